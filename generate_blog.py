@@ -74,23 +74,24 @@ def monetize_content(content: str) -> str:
         
     print(f"Fetched {len(affiliate_products)} affiliate products.")
     
-    # Enhance affiliate products with images
+    # Enhance affiliate products with images, fetching them concurrently
+    products_with_urls = [p for p in affiliate_products if p.get("url")]
+    print(f"Attempting to fetch images for {len(products_with_urls)} affiliate products")
+    image_paths = image_service.fetch_images_from_urls(
+        [(p["url"], p.get("product_name", "Affiliate Product")) for p in products_with_urls]
+    )
+    
     enriched_affiliate_products = []
     for product in affiliate_products:
-        product_url = product.get("url")
+        product["image_path"] = None
+        enriched_affiliate_products.append(product)
+    for product, image_path in zip(products_with_urls, image_paths):
         product_name = product.get("product_name", "Affiliate Product")
-        if product_url:
-            print(f"Attempting to fetch image for {product_name} from {product_url}")
-            image_path = image_service.fetch_image_from_url(product_url, product_name)
-            if image_path:
-                product["image_path"] = image_path 
-                print(f"Successfully fetched image for {product_name}: {image_path}")
-            else:
-                product["image_path"] = None
-                print(f"Failed to fetch image for {product_name}")
+        product["image_path"] = image_path
+        if image_path:
+            print(f"Successfully fetched image for {product_name}: {image_path}")
         else:
-            product["image_path"] = None
-        enriched_affiliate_products.append(product)
+            print(f"Failed to fetch image for {product_name}")
 
     monetized_content = ad_service.insert_affiliate_ads(
         monetized_content, 
@@ -197,20 +198,20 @@ def clear_images_directory():
     try:
         # Clear main images directory
         main_files_count = 0
-        for f in os.listdir(image_dir):
-            file_path = os.path.join(image_dir, f)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-                main_files_count += 1
+        with os.scandir(image_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.remove(entry.path)
+                    main_files_count += 1
         
         # Clear products subdirectory
         product_files_count = 0
         if os.path.exists(product_dir):
-            for f in os.listdir(product_dir):
-                file_path = os.path.join(product_dir, f)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    product_files_count += 1
+            with os.scandir(product_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        os.remove(entry.path)
+                        product_files_count += 1
         
         print(f"Cleared {main_files_count} files from images directory: {image_dir}")
         print(f"Cleared {product_files_count} files from products directory: {product_dir}")
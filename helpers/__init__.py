@@ -7,7 +7,11 @@ the main application functionality, including:
 - Environment variable setup
 - Image processing utilities
 - Authentication helpers
+- Fast JSON serialization (orjson when available)
+- One-time .env loading shared by the services
 """
 
 # Make utility functions available at the package level
 from .image_utils import clear_images_directory
+from .json_utils import dumps_bytes, loads
+from .env_utils import load_env
@@ -0,0 +1,17 @@
+import os
+
+# Project .env file, shared by every service module
+DOTENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
+
+_loaded = False
+
+def load_env() -> None:
+    """Load environment variables from the project .env file, once per process"""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+
+    if os.path.exists(DOTENV_PATH):
+        from dotenv import load_dotenv
+        load_dotenv(DOTENV_PATH)
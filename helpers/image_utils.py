@@ -14,14 +14,15 @@ def clear_images_directory():
     try:
         # Get all files in the directory
         file_count = 0
-        for filename in os.listdir(images_dir):
-            file_path = os.path.join(images_dir, filename)
-            if os.path.isfile(file_path):
-                os.unlink(file_path)
-                file_count += 1
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
-                file_count += 1
+        # scandir entries carry their file type, so no extra stat per entry
+        with os.scandir(images_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
+                    file_count += 1
+                elif entry.is_dir():
+                    shutil.rmtree(entry.path)
+                    file_count += 1
         
         print(f"Cleared {file_count} files from images directory: {images_dir}")
         return True
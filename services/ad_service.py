@@ -1,11 +1,11 @@
 from typing import List, Dict
 import os
-import json
 import requests
 from datetime import datetime
 import random
 import re
 from .sheets_service import google_sheets_service
+from helpers.json_utils import loads
 
 class AdService:
     def __init__(self):
@@ -27,8 +27,8 @@ class AdService:
         if os.path.exists(cache_file):
             try:
                 print(f"Loading affiliate products from local cache file: {cache_file}")
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                with open(cache_file, 'rb') as f:
+                    cached_data = loads(f.read())
                     
                 if isinstance(cached_data, dict) and 'products' in cached_data and cached_data['products']:
                     print(f"Successfully loaded {len(cached_data['products'])} products from cache")
@@ -1,6 +1,6 @@
 import os
 from typing import Dict, List, Optional
-from dotenv import load_dotenv
+from helpers.env_utils import load_env
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     DateRange,
@@ -14,9 +14,7 @@ from google.oauth2.service_account import Credentials
 from google.oauth2 import service_account
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
+load_env()
 
 class AnalyticsService:
     """Service for interacting with Google Analytics 4 for blog post analytics"""
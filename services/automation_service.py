@@ -8,12 +8,10 @@ from datetime import datetime, timedelta
 import os
 import json
 from typing import Dict, List, Optional, Any
-from dotenv import load_dotenv
+from helpers.env_utils import load_env
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
+load_env()
 
 from .trend_service import trend_service
 from .blog_service import blog_service
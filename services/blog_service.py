@@ -5,14 +5,12 @@ from io import BytesIO
 from typing import Dict, Optional, List
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from dotenv import load_dotenv
+from helpers.env_utils import load_env
 import re
 import html
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
+load_env()
 
 class BlogService:
     def __init__(self):
@@ -540,16 +538,12 @@ Make sure the content is original, informative, and engaging.
             file_count = 0
             
             # Remove all files in the images directory (but keep the directory itself)
-            # Also, keep the products subdirectory
-            for item in os.listdir(image_dir):
-                item_path = os.path.join(image_dir, item)
-                # Skip the products subdirectory
-                if os.path.isdir(item_path) and item == "products":
-                    continue
-                
-                if os.path.isfile(item_path):
-                    os.remove(item_path)
-                    file_count += 1
+            # Only files are removed, so the products subdirectory is kept
+            with os.scandir(image_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        os.remove(entry.path)
+                        file_count += 1
                     
             print(f"Cleared {file_count} files from images directory: {image_dir}")
             return True
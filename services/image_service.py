@@ -1,27 +1,145 @@
 import os
+import re
+import atexit
+import hashlib
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
-from dotenv import load_dotenv
-import json
+from helpers.env_utils import load_env
 import random
+import time
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import shutil
-from typing import Optional, List, Dict, Any
-from bs4 import BeautifulSoup
+from typing import Optional, List, Dict, Any, Tuple
+from helpers.json_utils import dumps_bytes, loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; fall back to BeautifulSoup
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
+    try:
+        import lxml  # noqa: F401
+        _BS4_PARSER = 'lxml'
+    except ImportError:
+        _BS4_PARSER = 'html.parser'
+    # Only build the tags we read; the rest of the page is skipped by the parser
+    _PRODUCT_PAGE_STRAINER = SoupStrainer(["title", "meta", "img"])
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if (os.path.exists(dotenv_path)):
-    load_dotenv(dotenv_path)
+load_env()
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts: fail fast on unreachable hosts, stay patient on slow bodies
+_PROBE_TIMEOUT = (1.5, 5)
+_DOWNLOAD_TIMEOUT = (1.5, 10)
+
+# Skip a host for _CIRCUIT_COOLDOWN seconds after this many connect failures within
+# _CIRCUIT_COOLDOWN seconds of each other
+_CIRCUIT_FAILURE_THRESHOLD = 3
+_CIRCUIT_COOLDOWN = 60
+
+# How long a downloaded product image is reused for the same product URL
+_URL_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+# Number of new URL cache entries to buffer before the index is written to disk
+_URL_CACHE_FLUSH_EVERY = 10
+
+# Amazon image URL suffixes, ordered by how often they resolve for current listings
+_AMAZON_IMG_SUFFIXES = ('._AC_SL1500_.jpg', '._AC_UL1500_.jpg', '._AC_SL1000_.jpg',
+                        '._SL1500_.jpg', '._SX1500_.jpg', '.jpg')
+# Amazon image CDNs, primary host first
+_AMAZON_CDNS = ('https://m.media-amazon.com/images/I/',
+                'https://images-na.ssl-images-amazon.com/images/I/')
+
+def _amazon_image_candidates(product_id: str) -> List[str]:
+    """Build the ordered list of candidate image URLs for an Amazon product ID"""
+    return [f"{cdn}{product_id}{suffix}" for cdn in _AMAZON_CDNS for suffix in _AMAZON_IMG_SUFFIXES]
+
+def _parse_product_page(html):
+    """
+    Extract the <title> text, og:image URL and <img> src values from a product page.
+    The <img> list is only built when there is no og:image to use.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first('title')
+        og_node = tree.css_first('meta[property="og:image"]')
+        title = title_node.text() if title_node else ""
+        og_image = og_node.attributes.get('content') if og_node else None
+        img_srcs = [] if og_image else [node.attributes.get('src') for node in tree.css('img')]
+        return title, og_image, img_srcs
+
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_PRODUCT_PAGE_STRAINER)
+    title_tag = soup.find('title')
+    og_tag = soup.find("meta", property="og:image")
+    title = title_tag.text if title_tag else ""
+    og_image = og_tag.get("content") if og_tag else None
+    img_srcs = [] if og_image else [img.get("src") for img in soup.find_all("img")]
+    return title, og_image, img_srcs
+
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+# <img> src filters for product page scraping (matched against the lowercased src)
+_SKIP_IMG_RE = re.compile(r'logo|icon|avatar|spinner|loader|banner|button|social|payment|footer')
+_IMG_EXT_RE = re.compile(r'\.(?:jpe?g|png|webp)')
+# Amazon product image paths and size markers (case-sensitive)
+_AMAZON_IMG_PATH_RE = re.compile(r'images/[IP]/|-images\.')
+_AMAZON_IMG_SIZE_RE = re.compile(r'_SL|_AC_|_SX|_UL')
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hard-link a fallback image into place, copying only if linking isn't possible
+    (e.g. across filesystems). Fallback images are never modified, so sharing the
+    inode is safe and avoids copying any bytes.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+# Maps every non-alphanumeric ASCII character to '_' for filename sanitizing
+_SAFE_NAME_TABLE = {i: '_' for i in range(128) if not chr(i).isalnum()}
+
+def _safe_filename(name: str) -> str:
+    """Replace each non-alphanumeric character in the first 50 characters of name with '_'"""
+    name = name[:50]
+    if name.isascii():
+        return name.translate(_SAFE_NAME_TABLE)
+    # Non-ASCII names keep the per-character check so accented letters survive
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+def _product_image_filename(prefix: str, product_name: str, extension: str = '.jpg') -> str:
+    """
+    Build a product image filename from the product name and current time. The
+    random suffix keeps concurrent fetches of same-named products from sharing a file.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return f"{prefix}_{_safe_filename(product_name)}_{timestamp}_{uuid.uuid4().hex[:8]}{extension}"
+
+def _magic_extension(first_bytes: bytes) -> Optional[str]:
+    """Return the file extension matching a JPEG, PNG or WebP signature, or None"""
+    if first_bytes.startswith(b'\xff\xd8\xff'):
+        return '.jpg'
+    if first_bytes.startswith(b'\x89PNG\r\n\x1a\n'):
+        return '.png'
+    if first_bytes[:4] == b'RIFF' and first_bytes[8:12] == b'WEBP':
+        return '.webp'
+    return None
+
+def _has_image_magic(first_bytes: bytes) -> bool:
+    """Check the leading bytes of a download for a JPEG, PNG or WebP signature"""
+    return _magic_extension(first_bytes) is not None
 
 class ImageService:
     def extract_amazon_product_image(self, product_url, product_name):
         """Try to extract a high-quality image for an Amazon product"""
-        import re
-        import requests
-        import os
-        from datetime import datetime
-        
         # Get product ID using various patterns
         patterns = [
             r'/dp/([A-Z0-9]{10})(?:/|\?|$)',  # Standard dp pattern
@@ -35,22 +153,14 @@ class ImageService:
             match = re.search(pattern, product_url)
             if match:
                 product_id = match.group(1)
-                print(f"Extracted Amazon product ID: {product_id}")
+                logger.debug("Extracted Amazon product ID: %s", product_id)
                 break
         
         if not product_id:
             return None
             
         # Try multiple high-quality image URL patterns
-        image_formats = [
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_UL1500_.jpg", 
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1000_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._SL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._SX1500_.jpg",
-            f"https://images-na.ssl-images-amazon.com/images/I/{product_id}._AC_SL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}.jpg"
-        ]
+        image_formats = _amazon_image_candidates(product_id)
         
         # Standard headers to avoid being blocked
         headers = {
@@ -58,37 +168,22 @@ class ImageService:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
         
-        # Try each image format
-        for image_url in image_formats:
+        # Probe all image formats at once and take the best-ranked one that responds
+        for image_url in self._probe_image_urls(image_formats, headers):
             try:
-                # Check if the image exists
-                response = requests.head(image_url, headers=headers, timeout=5)
+                logger.debug("Found Amazon product image: %s", image_url)
                 
-                if response.status_code == 200 and 'content-length' in response.headers:
-                    content_length = int(response.headers.get('content-length', 0))
-                    
-                    # Skip small images (likely icons)
-                    if content_length < 10000:
-                        continue
-                        
-                    print(f"Found Amazon product image: {image_url}")
-                    
-                    # Download the actual image
-                    img_response = requests.get(image_url, headers=headers, timeout=10)
-                    
-                    # Save the image
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                    image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                    image_path = os.path.join(self.product_image_dir, image_filename)
+                # Download and save the image, skipping non-image bodies
+                image_filename = _product_image_filename("product_amazon", product_name)
+                image_path = os.path.join(self.product_image_dir, image_filename)
+                
+                if not self._download_verified_image(image_url, headers, image_path):
+                    continue
                     
-                    with open(image_path, "wb") as f:
-                        f.write(img_response.content)
-                        
-                    print(f"Saved Amazon product image: {image_path}")
-                    return image_path
+                logger.debug("Saved Amazon product image: %s", image_path)
+                return image_path
             except Exception as e:
-                print(f"Error fetching {image_url}: {str(e)}")
+                logger.warning("Error fetching %s: %s", image_url, e)
                 continue
                 
         # If we got here, none of the image formats worked
@@ -100,19 +195,10 @@ class ImageService:
         Extract a high-quality product image for Amazon products using various techniques.
         Returns the path to the saved image or None if no image could be found.
         """
-        print(f"Trying to extract high-quality image for Amazon product ID: {product_id}")
+        logger.debug("Trying to extract high-quality image for Amazon product ID: %s", product_id)
         
         # List of possible image formats to try (ordered by preference)
-        image_formats = [
-            f"https://m.media-amazon.com/images/I/{product_id}.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_UL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1000_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._SL1500_.jpg",
-            f"https://m.media-amazon.com/images/I/{product_id}._SX1500_.jpg",
-            f"https://images-na.ssl-images-amazon.com/images/I/{product_id}.jpg",
-            f"https://images-na.ssl-images-amazon.com/images/I/{product_id}._AC_SL1500_.jpg"
-        ]
+        image_formats = _amazon_image_candidates(product_id)
         
         # Additional product ID formats to try (Amazon sometimes uses different ID formats)
         # Extract ASIN (Amazon Standard Identification Number) if present
@@ -120,43 +206,27 @@ class ImageService:
         if asin_match and asin_match.group(1) != product_id:
             # Try with the ASIN too
             asin = asin_match.group(1)
-            image_formats.extend([
-                f"https://m.media-amazon.com/images/I/{asin}.jpg",
-                f"https://m.media-amazon.com/images/I/{asin}._AC_SL1500_.jpg"
-            ])
+            image_formats.extend(_amazon_image_candidates(asin))
         
-        # Try each image URL format until one works
-        for image_url in image_formats:
+        # Probe all image URL formats at once and take the best-ranked one that responds
+        for image_url in self._probe_image_urls(image_formats, headers):
             try:
-                # Try to fetch this image directly
-                import requests
-                img_response = requests.head(image_url, headers=headers, timeout=5)
-                if img_response.status_code == 200 and 'content-length' in img_response.headers:
-                    # Check if image is large enough (not a tiny icon)
-                    content_length = int(img_response.headers.get('content-length', 0))
-                    if content_length > 10000:  # Skip tiny images (likely icons, not product images)
-                        print(f"Successfully found direct Amazon product image: {image_url}")
-                        
-                        # Download the image
-                        img_response = requests.get(image_url, headers=headers, timeout=10)
-                        
-                        # Extract product name from URL for better identification
-                        product_name = self._extract_product_name_from_amazon_url(product_url)
-                        
-                        # Save the image
-                        from datetime import datetime
-                        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                        safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                        image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                        image_path = os.path.join(self.product_image_dir, image_filename)
-                        
-                        with open(image_path, "wb") as f:
-                            f.write(img_response.content)
-                            
-                        print(f"Saved Amazon product image directly: {image_path}")
-                        return image_path
+                logger.debug("Successfully found direct Amazon product image: %s", image_url)
+                
+                # Extract product name from URL for better identification
+                product_name = self._extract_product_name_from_amazon_url(product_url)
+                
+                # Download and save the image, skipping non-image bodies
+                image_filename = _product_image_filename("product_amazon", product_name)
+                image_path = os.path.join(self.product_image_dir, image_filename)
+                
+                if not self._download_verified_image(image_url, headers, image_path):
+                    continue
+                    
+                logger.debug("Saved Amazon product image directly: %s", image_path)
+                return image_path
             except Exception as e:
-                print(f"Failed to fetch Amazon image {image_url}: {str(e)}")
+                logger.warning("Failed to fetch Amazon image %s: %s", image_url, e)
                 continue  # Try next format
         
         return None  # Failed to find a suitable image
@@ -164,8 +234,6 @@ class ImageService:
     def _extract_product_name_from_amazon_url(self, product_url):
         """Extract a more descriptive product name from an Amazon URL"""
         # For Amazon links, try to get product name from the URL
-        import re
-        
         # Default product name (fallback)
         product_name = "Amazon Product"
         
@@ -189,6 +257,142 @@ class ImageService:
         
         return product_name
 
+    def _probe_image_urls(self, image_urls, headers, min_size=10000):
+        """
+        HEAD all candidate image URLs concurrently and yield those that look like
+        real product images (HTTP 200 and a Content-Length above min_size).
+        URLs are yielded in the order given, so a candidate is only yielded once
+        every higher-ranked one has failed; pending probes are cancelled once the
+        caller stops iterating.
+        """
+        image_urls = [url for url in image_urls if not self._host_circuit_open(url)]
+        futures = [self._probe_pool.submit(self.session.head, url, headers=headers, timeout=_PROBE_TIMEOUT)
+                   for url in image_urls]
+        ranks = {future: rank for rank, future in enumerate(futures)}
+        passed = [None] * len(futures)
+        next_rank = 0
+        try:
+            for future in as_completed(futures):
+                rank = ranks[future]
+                passed[rank] = self._probe_passed(image_urls[rank], future, min_size)
+                # Release every candidate whose higher-ranked ones have all been decided
+                while next_rank < len(futures) and passed[next_rank] is not None:
+                    if passed[next_rank]:
+                        yield image_urls[next_rank]
+                    next_rank += 1
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _probe_passed(self, image_url, future, min_size):
+        """Return True if a finished HEAD probe found an image larger than min_size"""
+        try:
+            response = future.result()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            self._record_host_failure(image_url)
+            logger.warning("Failed to probe image %s: %s", image_url, e)
+            return False
+        except Exception as e:
+            logger.warning("Failed to probe image %s: %s", image_url, e)
+            return False
+        self._record_host_success(image_url)
+        # Skip tiny images (likely icons, not product images)
+        return response.status_code == 200 and int(response.headers.get('content-length', 0)) > min_size
+
+    def _host_circuit_open(self, url):
+        """Return True if the URL's host has failed repeatedly and is still cooling down"""
+        host = urllib.parse.urlparse(url).netloc
+        with self._host_failures_lock:
+            failures, last_failure = self._host_failures.get(host, (0, 0.0))
+            if failures < _CIRCUIT_FAILURE_THRESHOLD:
+                return False
+            if time.monotonic() - last_failure < _CIRCUIT_COOLDOWN:
+                logger.debug("Skipping %s: host %s is failing", url, host)
+                return True
+            # Cooldown elapsed; let the next request through as a trial
+            del self._host_failures[host]
+            return False
+
+    def _record_host_failure(self, url):
+        """Count a connect failure or timeout against the URL's host"""
+        host = urllib.parse.urlparse(url).netloc
+        now = time.monotonic()
+        with self._host_failures_lock:
+            failures, last_failure = self._host_failures.get(host, (0, 0.0))
+            # Only failures within the cooldown window of each other count towards opening
+            if now - last_failure > _CIRCUIT_COOLDOWN:
+                failures = 0
+            self._host_failures[host] = (failures + 1, now)
+
+    def _record_host_success(self, url):
+        """Reset the failure count for the URL's host"""
+        host = urllib.parse.urlparse(url).netloc
+        with self._host_failures_lock:
+            self._host_failures.pop(host, None)
+
+    def _read_product_page(self, response):
+        """
+        Read a streamed product page and return its title, og:image and <img> srcs.
+        Once </head> has arrived the head is parsed on its own; if it carries an
+        og:image the rest of the page is never downloaded.
+        """
+        body = bytearray()
+        head_checked = False
+        try:
+            for chunk in response.iter_content(chunk_size=8192):
+                body += chunk
+                if head_checked:
+                    continue
+                # Only rescan the new chunk plus enough overlap for a split tag
+                head_end = _HEAD_END_RE.search(body, max(0, len(body) - len(chunk) - 8))
+                if head_end:
+                    head_checked = True
+                    title, og_image, _ = _parse_product_page(bytes(body[:head_end.end()]))
+                    if og_image:
+                        return title, og_image, []
+            return _parse_product_page(bytes(body))
+        finally:
+            response.close()
+
+    def _download_verified_image(self, image_url, headers, image_path, timeout=_DOWNLOAD_TIMEOUT, min_size=0):
+        """
+        Stream an image to image_path, rejecting bodies that are not JPEG/PNG/WebP
+        or that are no larger than min_size bytes (placeholder images).
+        Returns True if the image was written, False otherwise.
+        """
+        if self._host_circuit_open(image_url):
+            return False
+        try:
+            img_response = self.session.get(image_url, headers=headers, timeout=timeout, stream=True)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self._record_host_failure(image_url)
+            raise
+        self._record_host_success(image_url)
+        try:
+            if img_response.status_code != 200:
+                return False
+            content_length = int(img_response.headers.get('content-length', 0))
+            if min_size and content_length and content_length <= min_size:
+                logger.warning("Rejected %d-byte image from %s", content_length, image_url)
+                return False
+            img_response.raw.decode_content = True
+            first_bytes = img_response.raw.read(12)
+            if not _has_image_magic(first_bytes):
+                logger.warning("Rejected non-image response from %s", image_url)
+                return False
+            with open(image_path, "wb") as f:
+                f.write(first_bytes)
+                shutil.copyfileobj(img_response.raw, f, length=65536)
+                written = f.tell()
+            if written <= min_size:
+                # No usable Content-Length up front, so check what actually arrived
+                os.remove(image_path)
+                logger.warning("Rejected %d-byte image from %s", written, image_url)
+                return False
+            return True
+        finally:
+            img_response.close()
+
     def __init__(self):
         self.unsplash_api_key = os.environ.get("UNSPLASH_API_KEY", "")
         self.gemini_api_key = os.environ.get("GEMINI_API_KEY", "")
@@ -200,17 +404,75 @@ class ImageService:
         
         # Create fallback directory if it doesn't exist
         os.makedirs(self.fallback_dir, exist_ok=True)
+        # (directory mtime, fallback image names), refreshed by _list_fallback_images
+        self._fallback_cache = None
         
         # Create product images directory
         self.product_image_dir = os.path.join(self.output_dir, "products")
         os.makedirs(self.product_image_dir, exist_ok=True)
         
+        # In-memory LRU cache of Gemini keyword results: topic -> (timestamp, keywords)
+        self._keyword_cache = OrderedDict()
+        self._keyword_cache_size = 512
+        self._keyword_cache_ttl = 3600  # seconds
+        
+        # Persistent HTTP session so keep-alive connections are reused across
+        # page fetches, probes and downloads instead of a new TLS handshake each time
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+        # Only retry gateway errors; connect/read failures fall through to the
+        # host circuit breaker instead of multiplying the probe timeouts
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=2, connect=0, read=0, backoff_factor=0.3,
+                                                status_forcelist=[502, 503, 504]))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        atexit.register(self.session.close)
+        
+        # Shared pool for concurrent image URL probes. requests releases the GIL
+        # during socket I/O, so threads overlap the round-trips for sync callers.
+        self._probe_pool = ThreadPoolExecutor(max_workers=8)
+        
+        # Per-host circuit breaker state: host -> (consecutive failures, last failure time)
+        self._host_failures = {}
+        self._host_failures_lock = threading.Lock()
+        
+        # On-disk index of downloaded product images: URL hash -> {"path", "saved_at"}.
+        # Kept in the project cache dir so clearing the image directories doesn't wipe it
+        cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.url_cache_path = os.path.join(cache_dir, "product_image_urls.json")
+        self._url_cache = self._load_url_cache()
+        self._url_cache_dirty = 0
+        self._url_cache_lock = threading.Lock()
+        # Product image paths that are fallback copies and must not be cached
+        self._fallback_outputs = set()
+        atexit.register(self._flush_url_cache)
+        
     def _generate_relevant_keywords(self, topic):
         """
-        Generate relevant image search keywords using Gemini API based on the blog topic
+        Generate relevant image search keywords using Gemini API based on the blog topic.
+        Results are cached per topic for an hour to avoid repeat API calls.
         """
+        cached = self._keyword_cache.get(topic)
+        if cached and time.monotonic() - cached[0] < self._keyword_cache_ttl:
+            self._keyword_cache.move_to_end(topic)
+            return list(cached[1])
+        
+        keywords = self._fetch_relevant_keywords(topic)
+        
+        # Only cache real Gemini results, not the bare-topic fallback
+        if keywords != [topic]:
+            self._keyword_cache[topic] = (time.monotonic(), tuple(keywords))
+            self._keyword_cache.move_to_end(topic)
+            while len(self._keyword_cache) > self._keyword_cache_size:
+                self._keyword_cache.popitem(last=False)
+        return keywords
+        
+    def _fetch_relevant_keywords(self, topic):
+        """Request image search keywords for a topic from the Gemini API"""
         if not self.gemini_api_key:
-            print("Gemini API key not available, using original topic as keywords")
+            logger.debug("Gemini API key not available, using original topic as keywords")
             return [topic]
             
         try:
@@ -237,10 +499,10 @@ class ImageService:
                 }
             }
             
-            response = requests.post(url, json=payload, headers=headers)
+            response = self.session.post(url, json=payload, headers=headers, timeout=_DOWNLOAD_TIMEOUT)
             
             if response.status_code != 200:
-                print(f"Gemini API Error for image keywords: {response.status_code}")
+                logger.warning("Gemini API Error for image keywords: %s", response.status_code)
                 return [topic]
                 
             response_data = response.json()
@@ -255,14 +517,14 @@ class ImageService:
                 if topic not in keywords:
                     keywords.append(topic)
                     
-                print(f"Generated image keywords: {keywords}")
+                logger.debug("Generated image keywords: %s", keywords)
                 return keywords
             else:
-                print("No content returned from Gemini API for image keywords")
+                logger.warning("No content returned from Gemini API for image keywords")
                 return [topic]
                 
         except Exception as e:
-            print(f"Error generating image keywords with Gemini: {str(e)}")
+            logger.warning("Error generating image keywords with Gemini: %s", e)
             return [topic]
             
     def generate_image(self, prompt):
@@ -283,10 +545,10 @@ class ImageService:
                 url = f"https://api.unsplash.com/search/photos?query={query}&per_page=10"
                 headers = {"Authorization": f"Client-ID {self.unsplash_api_key}"}
                 
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, headers=headers, timeout=_DOWNLOAD_TIMEOUT)
                 
                 if response.status_code != 200:
-                    print(f"Unsplash API Error for keyword '{keyword}': {response.text}")
+                    logger.warning("Unsplash API Error for keyword '%s': %s", keyword, response.text)
                     continue
                     
                 data = response.json()
@@ -302,10 +564,10 @@ class ImageService:
                     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
                     image_path = os.path.join(self.output_dir, f"blog_image_{timestamp}.jpg")
                     
-                    img_response = requests.get(image_url)
+                    img_response = self.session.get(image_url, timeout=_DOWNLOAD_TIMEOUT)
                     
                     if img_response.status_code != 200:
-                        print(f"Failed to download image from Unsplash: {img_response.status_code}")
+                        logger.warning("Failed to download image from Unsplash: %s", img_response.status_code)
                         continue
                         
                     # Save the image to disk
@@ -323,8 +585,8 @@ class ImageService:
                     }
                     
                     attribution_path = image_path + ".json"
-                    with open(attribution_path, "w") as f:
-                        json.dump(attribution, f, indent=2)
+                    with open(attribution_path, "wb") as f:
+                        f.write(dumps_bytes(attribution))
                         
                     return image_path
             
@@ -334,10 +596,10 @@ class ImageService:
             
             url = f"https://api.unsplash.com/search/photos?query={fallback_query}&per_page=5"
             headers = {"Authorization": f"Client-ID {self.unsplash_api_key}"}
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=_DOWNLOAD_TIMEOUT)
             
             if response.status_code != 200:
-                print(f"Unsplash API Error (fallback): {response.text}")
+                logger.warning("Unsplash API Error (fallback): %s", response.text)
                 return self._use_fallback_image(prompt)
                 
             data = response.json()
@@ -353,10 +615,10 @@ class ImageService:
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             image_path = os.path.join(self.output_dir, f"blog_image_{timestamp}.jpg")
             
-            img_response = requests.get(image_url)
+            img_response = self.session.get(image_url, timeout=_DOWNLOAD_TIMEOUT)
             
             if img_response.status_code != 200:
-                print(f"Failed to download image from Unsplash: {img_response.status_code}")
+                logger.warning("Failed to download image from Unsplash: %s", img_response.status_code)
                 return self._use_fallback_image(prompt)
                 
             # Save the image to disk
@@ -375,13 +637,13 @@ class ImageService:
             }
             
             attribution_path = image_path + ".json"
-            with open(attribution_path, "w") as f:
-                json.dump(attribution, f, indent=2)
+            with open(attribution_path, "wb") as f:
+                f.write(dumps_bytes(attribution))
                 
             return image_path
             
         except Exception as e:
-            print(f"Error getting image from Unsplash: {str(e)}")
+            logger.warning("Error getting image from Unsplash: %s", e)
             return self._use_fallback_image(prompt)
     
     def _use_fallback_image(self, prompt):
@@ -391,8 +653,7 @@ class ImageService:
             self._ensure_fallback_images_exist()
             
             # Get list of fallback images
-            fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                              if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
+            fallback_images = self._list_fallback_images()
             
             if not fallback_images:
                 return None
@@ -405,7 +666,7 @@ class ImageService:
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             output_path = os.path.join(self.output_dir, f"fallback_image_{timestamp}.jpg")
             
-            shutil.copy2(fallback_path, output_path)
+            _link_or_copy(fallback_path, output_path)
             
             # Create attribution metadata
             attribution = {
@@ -415,20 +676,33 @@ class ImageService:
             }
             
             attribution_path = output_path + ".json"
-            with open(attribution_path, "w") as f:
-                json.dump(attribution, f, indent=2)
+            with open(attribution_path, "wb") as f:
+                f.write(dumps_bytes(attribution))
                 
             return output_path
             
         except Exception as e:
-            print(f"Error using fallback image: {str(e)}")
+            logger.warning("Error using fallback image: %s", e)
             return None
     
+    def _list_fallback_images(self):
+        """List fallback image filenames, rescanning only when the directory changes"""
+        try:
+            dir_mtime = os.stat(self.fallback_dir).st_mtime_ns
+        except OSError:
+            return []
+        if self._fallback_cache is None or self._fallback_cache[0] != dir_mtime:
+            # scandir exposes the entry type without a separate stat() per file
+            with os.scandir(self.fallback_dir) as entries:
+                images = sorted(entry.name for entry in entries
+                                if entry.is_file() and entry.name.endswith(('.jpg', '.jpeg', '.png')))
+            self._fallback_cache = (dir_mtime, images)
+        return self._fallback_cache[1]
+    
     def _ensure_fallback_images_exist(self):
         """Ensure there are some fallback images available"""
         # Check if there are any images in the fallback directory
-        fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                          if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
+        fallback_images = self._list_fallback_images()
         
         # If no fallback images exist, create a text-based image with a placeholder
         if not fallback_images:
@@ -437,18 +711,69 @@ class ImageService:
                 # In a real implementation, you could use a library like Pillow to generate simple images
                 pass
             except Exception as e:
-                print(f"Error creating fallback images: {str(e)}")
+                logger.warning("Error creating fallback images: %s", e)
 
+    def _load_url_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the product URL -> image index, dropping entries whose files are gone"""
+        try:
+            with open(self.url_cache_path, 'rb') as f:
+                index = loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict):
+            return {}
+        return {key: entry for key, entry in index.items() if os.path.isfile(entry.get("path", ""))}
+    
+    def _flush_url_cache(self):
+        """Write the URL cache index to disk if it has unsaved entries"""
+        with self._url_cache_lock:
+            if not self._url_cache_dirty:
+                return
+            try:
+                tmp_path = f"{self.url_cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(dumps_bytes(self._url_cache, indent=False))
+                os.replace(tmp_path, self.url_cache_path)
+                self._url_cache_dirty = 0
+            except OSError as e:
+                logger.warning("Error saving product image cache: %s", e)
+    
+    @staticmethod
+    def _url_cache_key(product_url: str) -> str:
+        return hashlib.blake2b(product_url.encode('utf-8'), digest_size=8).hexdigest()
+    
     def fetch_image_from_url(self, product_url: str, product_name: str) -> Optional[str]:
         """
         Fetches an image from a product URL.
         Tries to find a prominent image on the page.
         Saves the image to the product_image_dir.
+        Images downloaded for the same URL within the last week are reused.
         """
         if not product_url:
             return None
+        
+        key = self._url_cache_key(product_url)
+        entry = self._url_cache.get(key)
+        if entry and time.time() - entry["saved_at"] < _URL_CACHE_MAX_AGE and os.path.isfile(entry["path"]):
+            logger.debug("Using cached image for %s: %s", product_url, entry["path"])
+            return entry["path"]
+        
+        image_path = self._fetch_image_from_url(product_url, product_name)
+        
+        # Fallback copies are not cached so the real image is retried next time
+        if image_path and image_path not in self._fallback_outputs:
+            with self._url_cache_lock:
+                self._url_cache[key] = {"path": image_path, "saved_at": time.time()}
+                self._url_cache_dirty += 1
+                flush = self._url_cache_dirty >= _URL_CACHE_FLUSH_EVERY
+            if flush:
+                self._flush_url_cache()
+        return image_path
+    
+    def _fetch_image_from_url(self, product_url: str, product_name: str) -> Optional[str]:
+        """Download a product image from its page, without consulting the URL cache"""
         try:
-            print(f"Fetching image for '{product_name}' from URL: {product_url}")
+            logger.debug("Fetching image for '%s' from URL: %s", product_name, product_url)
             
             # For Amazon, check if we're hitting a CAPTCHA (Amazon has strong anti-bot measures)
 
@@ -474,136 +799,85 @@ class ImageService:
             if is_amazon:
                 # Try to extract product name directly from URL
                 # For Amazon links, get product info from the URL (dp/PRODUCTID)
-                import re
                 product_id_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
                 if product_id_match:
                     product_id = product_id_match.group(1)
-                    print(f"Extracted Amazon product ID: {product_id}")
+                    logger.debug("Extracted Amazon product ID: %s", product_id)
                     
                     # Try multiple image formats and sizes for Amazon product images
-                    amazon_image_urls = [
-                        f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1500_.jpg",
-                        f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1000_.jpg",
-                        f"https://m.media-amazon.com/images/I/{product_id}._AC_SL500_.jpg",
-                        f"https://m.media-amazon.com/images/I/{product_id}.jpg",
-                        f"https://images-na.ssl-images-amazon.com/images/I/{product_id}.jpg",
-                        f"https://images-na.ssl-images-amazon.com/images/I/{product_id}._AC_SL1500_.jpg"
-                    ]
+                    amazon_image_urls = _amazon_image_candidates(product_id)
                     
-                    # Try each image URL format until one works
-                    for amazon_image_url in amazon_image_urls:
+                    # Probe all image URL formats at once and take the best-ranked one that responds
+                    for amazon_image_url in self._probe_image_urls(amazon_image_urls, headers):
                         try:
-                            # Try to fetch this image directly
-                            img_response = requests.head(amazon_image_url, headers=headers, timeout=5)
-                            if img_response.status_code == 200 and 'content-length' in img_response.headers:
-                                # Check if image is large enough (not a tiny icon)
-                                content_length = int(img_response.headers.get('content-length', 0))
-                                if content_length > 10000:  # Skip tiny images (likely icons, not product images)
-                                    print(f"Successfully found direct Amazon product image: {amazon_image_url}")
-                                    
-                                    # Download the image
-                                    img_response = requests.get(amazon_image_url, headers=headers, timeout=10)
-                                    
-                                    # Save the image
-                                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                                    safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                                    image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                                    image_path = os.path.join(self.product_image_dir, image_filename)
-                                    
-                                    with open(image_path, "wb") as f:
-                                        f.write(img_response.content)
-                                        
-                                    print(f"Saved Amazon product image directly: {image_path}")
-                                    return image_path
+                            logger.debug("Successfully found direct Amazon product image: %s", amazon_image_url)
+                            
+                            # Download and save the image, skipping non-image bodies
+                            image_filename = _product_image_filename("product_amazon", product_name)
+                            image_path = os.path.join(self.product_image_dir, image_filename)
+                            
+                            if not self._download_verified_image(amazon_image_url, headers, image_path):
+                                continue
+                                
+                            logger.debug("Saved Amazon product image directly: %s", image_path)
+                            return image_path
                         except Exception as e:
-                            print(f"Failed to fetch Amazon image {amazon_image_url}: {str(e)}")
+                            logger.warning("Failed to fetch Amazon image %s: %s", amazon_image_url, e)
                             continue  # Try next format
                     
-                    # For Amazon products, generate a default image path to handle captcha issues
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                    image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                    image_path = os.path.join(self.product_image_dir, image_filename)
-                    
-                    # Create a fallback image for Amazon products (this will be replaced if we can fetch the real image)
-                    # Copy a fallback image to the product image directory
-                    fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                                    if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
-                    if fallback_images:
-                        fallback_path = os.path.join(self.fallback_dir, fallback_images[0])
-                        shutil.copy2(fallback_path, image_path)
-                        print(f"Created fallback image for Amazon product: {image_path}")
-                        
-                        # Try to get more accurate product name
-                        if product_name == "Product 1" or product_name.startswith("Product "):
-                            # Extract product name from URL
-                            url_parts = product_url.split('/')
-                            for part in url_parts:
-                                if part.startswith('dp') or part.startswith('gp'):
-                                    continue
-                                if len(part) > 5 and '-' in part and not part.startswith('ref=') and not part.startswith('pf_rd'):
-                                    better_name = part.replace('-', ' ').title()
-                                    print(f"Extracted better product name from URL: {better_name}")
-                                    return image_path
-                        
+                    # Create a fallback image for Amazon products to handle captcha issues
+                    image_path = self._amazon_fallback_image(product_name)
+                    if image_path:
                         return image_path
             
-            # Now try to fetch the actual page
-            response = requests.get(product_url, headers=headers, timeout=10, allow_redirects=True)
-              # For debugging
-            if "captcha" in response.url.lower() or response.status_code >= 400:
-                print(f"Received error or captcha page: {response.url}")
-                if is_amazon:
-                    # Try to extract product name directly from URL
-                    # For Amazon links, get product info from the URL (dp/PRODUCTID)
-                    import re
-                    product_id_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
-                    if product_id_match:
-                        product_id = product_id_match.group(1)
-                        # Try the fixed format amazon URL for product images
-                        amazon_image_url = f"https://m.media-amazon.com/images/I/{product_id}._AC_SL1500_.jpg"
-                        try:
-                            img_response = requests.get(amazon_image_url, headers=headers, timeout=10)
-                            if img_response.status_code == 200 and len(img_response.content) > 10000:
-                                # Save the image
-                                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                                safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                                image_filename = f"product_amazon_fallback_{safe_product_name}_{timestamp}.jpg"
+            # Now try to fetch the actual page, unless its host keeps failing
+            if self._host_circuit_open(product_url):
+                return self._amazon_fallback_image(product_name) if is_amazon else None
+            try:
+                response = self.session.get(product_url, headers=headers, timeout=_DOWNLOAD_TIMEOUT, allow_redirects=True, stream=True)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._record_host_failure(product_url)
+                raise
+            self._record_host_success(product_url)
+            try:
+                  # For debugging
+                if "captcha" in response.url.lower() or response.status_code >= 400:
+                    logger.warning("Received error or captcha page: %s", response.url)
+                    if is_amazon:
+                        # Try to extract product name directly from URL
+                        # For Amazon links, get product info from the URL (dp/PRODUCTID)
+                        product_id_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
+                        if product_id_match:
+                            product_id = product_id_match.group(1)
+                            # Try the fixed format amazon URL for product images
+                            amazon_image_url = _amazon_image_candidates(product_id)[0]
+                            try:
+                                image_filename = _product_image_filename("product_amazon_fallback", product_name)
                                 image_path = os.path.join(self.product_image_dir, image_filename)
-                                
-                                with open(image_path, "wb") as f:
-                                    f.write(img_response.content)
-                                    
-                                print(f"Saved fallback Amazon product image: {image_path}")
-                                return image_path
-                        except Exception as e:
-                            print(f"Failed to fetch fallback Amazon image: {str(e)}")
-                    
-                    # Use fallback for Amazon products
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                    image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                    image_path = os.path.join(self.product_image_dir, image_filename)
+                            
+                                # Save the image only if the body really is an image and is
+                                # big enough not to be Amazon's placeholder
+                                if self._download_verified_image(amazon_image_url, headers, image_path, min_size=10000):
+                                    logger.debug("Saved fallback Amazon product image: %s", image_path)
+                                    return image_path
+                            except Exception as e:
+                                logger.warning("Failed to fetch fallback Amazon image: %s", e)
                     
-                    # Copy a fallback image
-                    fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                                    if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
-                    if fallback_images:
-                        fallback_path = os.path.join(self.fallback_dir, fallback_images[0])
-                        shutil.copy2(fallback_path, image_path)
-                        print(f"Using fallback image for Amazon product with captcha: {image_path}")
-                        return image_path
-                return None
+                        # Use fallback for Amazon products
+                        return self._amazon_fallback_image(product_name)
+                    return None
             
-            response.raise_for_status() # Raise an exception for bad status codes
+                response.raise_for_status() # Raise an exception for bad status codes
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+                page_title, og_image, images = self._read_product_page(response)
+            finally:
+                # Also covers the early returns and raise_for_status above
+                response.close()
             
             # Also try to extract product name and details from the page
-            page_title = soup.find('title')
-            if page_title and page_title.text:
+            if page_title:
                 # Clean and extract product name from title
-                clean_title = page_title.text.strip()
+                clean_title = page_title.strip()
                 # For Amazon, remove the Amazon.in part
                 if "Amazon" in clean_title:
                     clean_title = clean_title.split(':')[0].strip()
@@ -612,140 +886,146 @@ class ImageService:
                 product_name = clean_title[:100]  # Limit length
             
             # Try to find Open Graph image first (most reliable for product images)
-            og_image = soup.find("meta", property="og:image")
-            if og_image and og_image.get("content"):
-                image_url = og_image["content"]
+            if og_image:
+                image_url = og_image
             else:
                 # Fallback: Find the largest image on the page (simple heuristic)
-                images = soup.find_all("img")
                 best_image_url = None
-                max_area = 0
-                product_image_candidates = []
                 if not images:
-                    print(f"No <img> tags found on {product_url}")
+                    logger.warning("No <img> tags found on %s", product_url)
                     return None
 
                 # First pass: collect all potential product images with their sizes
-                for img in images:
-                    src = img.get("src")
+                for src in images:
                     if not src or src.startswith("data:image"): # ignore inline images
                         continue
                     
                     # Skip typical non-product images
                     img_lower = src.lower()
-                    if any(skip in img_lower for skip in ["logo", "icon", "avatar", "spinner", "loader", "banner", "button", "social", "payment", "footer"]):
+                    if _SKIP_IMG_RE.search(img_lower):
+                        continue
+                    
+                    # Basic check for image type, allowing for query parameters after the extension
+                    if not _IMG_EXT_RE.search(img_lower):
                         continue
                     
                     # Make URL absolute
                     src = urllib.parse.urljoin(product_url, src)
-                    
-                    # Basic check for image type (can be improved)
-                    if not (src.lower().endswith((".jpg", ".jpeg", ".png", ".webp"))):
-                        # Try to see if there's a URL parameter that indicates an image
-                        if ".jpg" in src or ".jpeg" in src or ".png" in src or ".webp" in src:
-                            # It's probably an image with query parameters
-                            pass
-                        else:
-                            continue
                         
-                    # Prefer Amazon product images
-                    if "amazon" in product_url.lower():
-                        # Amazon product images typically follow these patterns
-                        if "images/I/" in src or "/images/P/" in src or "-images." in src:
-                            # Check if it's likely a product image (avoid small thumbnails)
-                            if ("_SL" in src or "_AC_" in src or "_SX" in src or "_UL" in src) and not "icon" in src.lower() and not "logo" in src.lower():
-                                best_image_url = src
-                                print(f"Found Amazon product image: {src}")
-                                break
-                    # Simplistic way to find a prominent image - check for width/height or just take the first one
+                    # Prefer Amazon product images (avoid small thumbnails)
+                    if is_amazon and _AMAZON_IMG_PATH_RE.search(src) and _AMAZON_IMG_SIZE_RE.search(src):
+                        logger.debug("Found Amazon product image: %s", src)
+                    # Simplistic way to find a prominent image - just take the first plausible candidate
                     # This part can be significantly improved with more sophisticated heuristics
-                    if "logo" not in src.lower() and "icon" not in src.lower() and "avatar" not in src.lower() and "spinner" not in src.lower() and "loader" not in src.lower():
-                        best_image_url = src # Take the first plausible candidate
-                        break 
+                    best_image_url = src
+                    break 
                 
                 if not best_image_url:
                      # If no specific image found, take the first src
-                    img_tags = soup.find_all('img')
-                    if img_tags:
-                        first_img_src = img_tags[0].get('src')
+                    if images:
+                        first_img_src = images[0]
                         if first_img_src and not first_img_src.startswith("data:image"):
                              best_image_url = urllib.parse.urljoin(product_url, first_img_src)
                     if not best_image_url:
-                        print(f"Could not find a suitable image on {product_url}")
+                        logger.warning("Could not find a suitable image on %s", product_url)
                         return None
                 image_url = best_image_url
 
-            print(f"Found image URL: {image_url}")
+            logger.debug("Found image URL: %s", image_url)
             
-            # Download the image
-            img_response = requests.get(image_url, headers=headers, timeout=10, stream=True)
-            img_response.raise_for_status()
+            # Download the image, unless its host keeps failing
+            if self._host_circuit_open(image_url):
+                return self._amazon_fallback_image(product_name) if is_amazon else None
+            try:
+                img_response = self.session.get(image_url, headers=headers, timeout=_DOWNLOAD_TIMEOUT, stream=True)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._record_host_failure(image_url)
+                raise
+            self._record_host_success(image_url)
+            try:
+                img_response.raise_for_status()
 
-            # Sanitize product name for filename
-            safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            
-            # Get file extension
-            content_type = img_response.headers.get('content-type')
-            extension = '.jpg' # default
-            if content_type:
-                if 'jpeg' in content_type:
-                    extension = '.jpg'
-                elif 'png' in content_type:
-                    extension = '.png'
-                elif 'webp' in content_type:
-                    extension = '.webp'
-            else: # Try to guess from URL
-                parsed_url = urllib.parse.urlparse(image_url)
-                path_extension = os.path.splitext(parsed_url.path)[1]
-                if path_extension and path_extension.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                    extension = path_extension.lower()
-
-            image_filename = f"product_{safe_product_name}_{timestamp}{extension}"
-            image_path = os.path.join(self.product_image_dir, image_filename)
+                # Get file extension from the image signature, since servers often
+                # mislabel the content type; fall back to the headers and URL
+                img_response.raw.decode_content = True
+                first_bytes = img_response.raw.read(16)
+                extension = _magic_extension(first_bytes)
+                if not extension:
+                    content_type = img_response.headers.get('content-type')
+                    extension = '.jpg' # default
+                    if content_type:
+                        if 'jpeg' in content_type:
+                            extension = '.jpg'
+                        elif 'png' in content_type:
+                            extension = '.png'
+                        elif 'webp' in content_type:
+                            extension = '.webp'
+                    else: # Try to guess from URL
+                        parsed_url = urllib.parse.urlparse(image_url)
+                        path_extension = os.path.splitext(parsed_url.path)[1]
+                        if path_extension and path_extension.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
+                            extension = path_extension.lower()
+
+                image_filename = _product_image_filename("product", product_name, extension)
+                image_path = os.path.join(self.product_image_dir, image_filename)
             
-            with open(image_path, "wb") as f:
-                for chunk in img_response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                # Copy the raw stream straight to disk in 64KB blocks
+                with open(image_path, "wb") as f:
+                    f.write(first_bytes)
+                    shutil.copyfileobj(img_response.raw, f, length=65536)
+            finally:
+                img_response.close()
             
-            print(f"Saved product image to: {image_path}")
+            logger.debug("Saved product image to: %s", image_path)
             return image_path
 
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching page {product_url} or image: {e}")
+            logger.warning("Error fetching page %s or image: %s", product_url, e)
             # For Amazon products, use a fallback image
             if "amazon" in product_url.lower():
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                image_path = os.path.join(self.product_image_dir, image_filename)
-                
-                # Copy a fallback image
-                fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                                  if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
-                if fallback_images:
-                    fallback_path = os.path.join(self.fallback_dir, fallback_images[0])
-                    shutil.copy2(fallback_path, image_path)
-                    print(f"Using fallback image for Amazon product with error: {image_path}")
-                    return image_path
+                return self._amazon_fallback_image(product_name)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred while fetching image from {product_url}: {e}")
+            logger.warning("An unexpected error occurred while fetching image from %s: %s", product_url, e)
             # For Amazon products, use a fallback image
             if "amazon" in product_url.lower():
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                safe_product_name = "".join(c if c.isalnum() else "_" for c in product_name[:50])
-                image_filename = f"product_amazon_{safe_product_name}_{timestamp}.jpg"
-                image_path = os.path.join(self.product_image_dir, image_filename)
-                
-                # Copy a fallback image
-                fallback_images = [f for f in os.listdir(self.fallback_dir) 
-                                  if f.endswith(('.jpg', '.jpeg', '.png')) and os.path.isfile(os.path.join(self.fallback_dir, f))]
-                if fallback_images:
-                    fallback_path = os.path.join(self.fallback_dir, fallback_images[0])
-                    shutil.copy2(fallback_path, image_path)
-                    print(f"Using fallback image for Amazon product with general error: {image_path}")
-                    return image_path
+                return self._amazon_fallback_image(product_name)
             return None
 
+    def _amazon_fallback_image(self, product_name: str) -> Optional[str]:
+        """
+        Place a local fallback image in the product directory for an Amazon product
+        whose real image couldn't be fetched. Returns None if there are no fallback images.
+        """
+        fallback_images = self._list_fallback_images()
+        if not fallback_images:
+            return None
+        
+        image_filename = _product_image_filename("product_amazon", product_name)
+        image_path = os.path.join(self.product_image_dir, image_filename)
+        
+        _link_or_copy(os.path.join(self.fallback_dir, fallback_images[0]), image_path)
+        self._fallback_outputs.add(image_path)
+        logger.warning("Using fallback image for Amazon product: %s", image_path)
+        return image_path
+
+    def fetch_images_from_urls(self, products: List[Tuple[str, str]], max_workers: int = 8) -> List[Optional[str]]:
+        """
+        Fetch images for several products concurrently.
+        
+        Args:
+            products: List of (product_url, product_name) pairs
+            max_workers: Maximum number of products fetched at once
+            
+        Returns:
+            Saved image paths (or None) in the same order as products
+        """
+        if not products:
+            return []
+        # A dedicated pool: fetch_image_from_url itself submits probes to _probe_pool
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(products))) as executor:
+            image_paths = list(executor.map(lambda product: self.fetch_image_from_url(*product), products))
+        self._flush_url_cache()
+        return image_paths
+
 image_service = ImageService()
@@ -1,9 +1,20 @@
 import re
+import heapq
 from collections import Counter
+from operator import itemgetter
 from typing import Dict, List, Optional
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
+
+# Patterns used by SEOService.analyze_seo, compiled once at import
+_RE_TAGS = re.compile(r'<[^>]*>')
+_RE_WORDS = re.compile(r'\w+')
+_RE_SENTENCE_END = re.compile(r'[.!?]+')
+_RE_HEADINGS = re.compile(r'<h[1-6][^>]*>')
+# Paragraphs and lists are detected by their opening tags only. A lazy
+# '<p>.*?</p>' match with DOTALL backtracks badly on malformed HTML, and the
+# analysis only needs to know how many were opened, not that they were closed.
+_RE_PARAGRAPHS = re.compile(r'<p\b', re.IGNORECASE)
+_RE_IMAGES = re.compile(r'<img[^>]*>')
+_RE_LISTS = re.compile(r'<[ou]l\b', re.IGNORECASE)
 
 class SEOService:
     def __init__(self):
@@ -14,64 +25,67 @@ class SEOService:
         self.min_paragraphs = 5
         self.max_paragraphs_length = 150  # words
         
-        # Set up NLTK resources
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
+        # Stopwords are loaded on first analysis so importing the service doesn't pull in NLTK
+        self._stop_words = None
+
+    def _get_stop_words(self) -> frozenset:
+        """Load the English stopword list once, importing NLTK on first use"""
+        if self._stop_words is None:
             try:
-                nltk.download('punkt', quiet=True)
-            except:
-                pass
+                import nltk
+                from nltk.corpus import stopwords
                 
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            try:
-                nltk.download('stopwords', quiet=True)
+                # Set up NLTK resources (only the stopwords corpus is needed)
+                try:
+                    nltk.data.find('corpora/stopwords')
+                except LookupError:
+                    try:
+                        nltk.download('stopwords', quiet=True)
+                    except:
+                        pass
+                self._stop_words = frozenset(stopwords.words('english'))
             except:
-                pass
+                # Fallback if NLTK fails
+                self._stop_words = frozenset({'the', 'and', 'is', 'in', 'to', 'of', 'a', 'for', 'on', 'with', 'that', 'this', 'it', 'are', 'be', 'as', 'by', 'was', 'or'})
+        return self._stop_words
 
     def analyze_seo(self, content: str) -> Dict:
         """Analyze content for SEO optimization and provide recommendations"""
         # Strip HTML tags for raw text analysis
-        raw_text = re.sub(r'<[^>]*>', ' ', content)
+        raw_text = _RE_TAGS.sub(' ', content)
         
         # Run basic text analysis
-        words = re.findall(r'\w+', raw_text.lower())
+        words = _RE_WORDS.findall(raw_text.lower())
         word_count = len(words)
         
-        # Use NLTK for better tokenization if available
-        try:
-            sentences = sent_tokenize(raw_text)
-            stop_words = set(stopwords.words('english'))
-        except:
-            # Fallback if NLTK fails
-            sentences = [s.strip() for s in re.split(r'[.!?]+', raw_text) if s.strip()]
-            stop_words = {'the', 'and', 'is', 'in', 'to', 'of', 'a', 'for', 'on', 'with', 'that', 'this', 'it', 'are', 'be', 'as', 'by', 'was', 'or'}
+        # Sentence count only needs terminal punctuation, so a regex split is enough
+        # (punkt's sent_tokenize is much slower for the same purpose here)
+        sentence_count = sum(1 for s in _RE_SENTENCE_END.split(raw_text) if s.strip())
+        
+        stop_words = self._get_stop_words()
         
-        # Calculate word frequency excluding stop words
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
-        word_frequency = Counter(filtered_words)
+        # Calculate word frequency excluding stop words, in a single pass
+        word_frequency = Counter(word for word in words if len(word) > 2 and word not in stop_words)
         
-        # Find potential keywords (most common meaningful words)
-        keywords = {word: count for word, count in word_frequency.most_common(15) 
-                   if word not in stop_words}
+        # Find potential keywords (most common meaningful words); stop words are
+        # already filtered out, and a bounded heap avoids sorting every unique word
+        keywords = dict(heapq.nlargest(15, word_frequency.items(), key=itemgetter(1)))
         
         # Calculate keyword density
         keyword_density = {word: count/word_count for word, count in keywords.items()}
         
         # HTML structure analysis
-        headings = len(re.findall(r'<h[1-6][^>]*>', content))
-        paragraphs = len(re.findall(r'<p[^>]*>.*?</p>', content, re.DOTALL))
+        headings = len(_RE_HEADINGS.findall(content))
+        paragraphs = len(_RE_PARAGRAPHS.findall(content))
         
         # Check for images
-        images = len(re.findall(r'<img[^>]*>', content))
+        images = len(_RE_IMAGES.findall(content))
         
         # Average sentence length and paragraph length
-        avg_sentence_length = word_count / max(1, len(sentences))
+        avg_sentence_length = word_count / max(1, sentence_count)
         
         # Check for lists/bullets
-        has_lists = bool(re.search(r'<[ou]l[^>]*>.*?</[ou]l>', content, re.DOTALL))
+        has_lists = bool(_RE_LISTS.search(content))
         
         # Compile the issues and recommendations
         issues = []
@@ -124,10 +138,12 @@ class SEOService:
         # Calculate overall SEO score
         score = self._calculate_score(word_count, headings, paragraphs, images, has_lists, len(issues))
         
+        top_keywords = dict(list(keywords.items())[:10])  # Top 10 keywords
+        
         return {
             'word_count': word_count,
-            'keywords': dict(list(keywords.items())[:10]),  # Top 10 keywords
-            'keyword_density': {k: v for k, v in keyword_density.items() if k in dict(list(keywords.items())[:10])},
+            'keywords': top_keywords,
+            'keyword_density': {k: v for k, v in keyword_density.items() if k in top_keywords},
             'headings': headings,
             'paragraphs': paragraphs,
             'images': images,
@@ -167,9 +183,14 @@ class SEOService:
             
         return max(0, min(100, base_score))
     
-    def get_improvement_suggestions(self, content: str, target_keywords: Optional[List[str]] = None) -> Dict:
-        """Get specific suggestions to improve content for better SEO"""
-        seo_report = self.analyze_seo(content)
+    def get_improvement_suggestions(self, content: str, target_keywords: Optional[List[str]] = None,
+                                    seo_report: Optional[Dict] = None) -> Dict:
+        """
+        Get specific suggestions to improve content for better SEO.
+        Pass seo_report when analyze_seo has already been run on the same content.
+        """
+        if seo_report is None:
+            seo_report = self.analyze_seo(content)
         
         suggestions = []
         
@@ -191,8 +212,9 @@ class SEOService:
             
         # Target keyword suggestions
         if target_keywords:
+            content_lower = content.lower()
             for keyword in target_keywords:
-                if keyword.lower() not in content.lower():
+                if keyword.lower() not in content_lower:
                     suggestions.append({
                         "type": "keyword_usage",
                         "suggestion": f"Include the target keyword '{keyword}' in your content",
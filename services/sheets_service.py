@@ -2,25 +2,65 @@
 Google Sheets integration for fetching affiliate product data.
 """
 import os
-import json
+import copy
+import logging
+import threading
+import time
+from datetime import datetime
 from typing import List, Dict, Any, Optional
-import gspread
-from gspread.exceptions import SpreadsheetNotFound, NoValidUrlKeyFound, APIError
-from google.oauth2 import service_account
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from dotenv import load_dotenv    # Load environment variables
-load_dotenv()
+# gspread and the google-auth libraries are imported inside the methods that use
+# them, so importing this module (e.g. via ad_service) stays cheap when the sheet
+# is never read or the affiliate product cache is fresh
+from helpers.env_utils import load_env
+from helpers.json_utils import dumps_bytes, loads
+load_env()    # Load environment variables
 
-# Set client email from service account if not explicitly defined
-if os.environ.get("GOOGLE_SERVICE_ACCOUNT_INFO") and not os.environ.get("GA_CLIENT_EMAIL"):
+logger = logging.getLogger(__name__)
+
+# Parse the service account JSON from the environment once, rather than on every authentication
+_SERVICE_ACCOUNT_INFO = None
+_SERVICE_ACCOUNT_ERROR = None
+if os.environ.get("GOOGLE_SERVICE_ACCOUNT_INFO"):
     try:
-        service_account_dict = json.loads(os.environ.get("GOOGLE_SERVICE_ACCOUNT_INFO", "{}"))
-        if "client_email" in service_account_dict:
-            os.environ["GA_CLIENT_EMAIL"] = service_account_dict["client_email"]
-    except json.JSONDecodeError:
-        pass
+        _SERVICE_ACCOUNT_INFO = loads(os.environ["GOOGLE_SERVICE_ACCOUNT_INFO"])
+    except ValueError as e:
+        _SERVICE_ACCOUNT_ERROR = e
+
+# Set client email from service account if not explicitly defined
+if _SERVICE_ACCOUNT_INFO and not os.environ.get("GA_CLIENT_EMAIL"):
+    if "client_email" in _SERVICE_ACCOUNT_INFO:
+        os.environ["GA_CLIENT_EMAIL"] = _SERVICE_ACCOUNT_INFO["client_email"]
+
+# Connection pool for the Sheets/Drive session; retries cover rate limits and transient 5xx
+SHEETS_POOL_CONNECTIONS = 10
+SHEETS_POOL_MAXSIZE = 20
+SHEETS_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# How long (in seconds) formatted affiliate products are reused before the sheet is read again
+PRODUCTS_CACHE_TTL = 300
+
+# Credentials this close to expiry (in seconds) are refreshed before use
+TOKEN_REFRESH_MARGIN = 300
+
+# Main project directory and the paths for credential files
+_MAIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SERVICE_ACCOUNT_FILE = os.path.join(_MAIN_DIR, "service-account.json")
+_OAUTH_TOKEN_FILE = os.path.join(_MAIN_DIR, "templates", "token.json")
+_OAUTH_CREDENTIALS_FILE = os.path.join(_MAIN_DIR, "templates", "credentials.json")
+
+# Directory for cached spreadsheet contents
+_CACHE_DIR = os.path.join(_MAIN_DIR, "cache")
+
+# Scopes for Google Sheets API
+SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+# Service accounts also get Drive metadata access to check a sheet's modifiedTime
+SERVICE_ACCOUNT_SCOPES = SHEETS_SCOPES + ['https://www.googleapis.com/auth/drive.metadata.readonly']
+
+# Drive API endpoint used to read a spreadsheet's modifiedTime
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files/{file_id}"
+
+# Spreadsheet columns read by fetch_affiliate_products
+AFFILIATE_COLUMNS = ['Affiliate Links', 'Affiliate Link', 'Product Name', 'Description', 'Price', 'Image URL']
 
 class GoogleSheetsService:
     """
@@ -32,16 +72,29 @@ class GoogleSheetsService:
         """Initialize the Google Sheets service with required credentials"""
         self.creds = None
         self.client = None
+        self.session = None  # Pooled AuthorizedSession shared by gspread and Drive calls
+        # use_service_account setting the current client was authenticated with
+        self._auth_mode = None
+        # Serializes authentication so concurrent callers don't all refresh at once
+        self._auth_lock = threading.Lock()
+        # Timer that refreshes the token in the background before it expires
+        self._refresh_timer = None
         
-        # Main project directory
-        self.main_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # (spreadsheet_url, worksheet_name) -> (fetched_at, formatted products)
+        self._products_cache = {}
+        self._products_cache_lock = threading.Lock()
         
-        # Paths for credential files
-        self.service_account_file = os.path.join(self.main_dir, "service-account.json")
-        self.oauth_token_file = os.path.join(self.main_dir, "templates", "token.json")
-        self.oauth_credentials_file = os.path.join(self.main_dir, "templates", "credentials.json")
-          # Scopes for Google Sheets API
-        self.scopes = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+        # (spreadsheet_id, worksheet title) -> (modified_time, header row)
+        self._headers_cache = {}
+        
+        # Project paths and scopes are computed once at import
+        self.main_dir = _MAIN_DIR
+        self.service_account_file = _SERVICE_ACCOUNT_FILE
+        self.oauth_token_file = _OAUTH_TOKEN_FILE
+        self.oauth_credentials_file = _OAUTH_CREDENTIALS_FILE
+        self.cache_dir = _CACHE_DIR
+        self.scopes = SHEETS_SCOPES
+        self.service_account_scopes = SERVICE_ACCOUNT_SCOPES
         
     def authenticate(self, use_service_account: bool = True) -> bool:
         """
@@ -53,55 +106,160 @@ class GoogleSheetsService:
         Returns:
             bool: True if authentication was successful
         """
-        try:
-            # Check environment setting if not explicitly provided
-            if os.getenv('USE_SERVICE_ACCOUNT') is not None:
-                use_service_account = os.getenv('USE_SERVICE_ACCOUNT').lower() == 'true'
+        # Check environment setting if not explicitly provided
+        if os.getenv('USE_SERVICE_ACCOUNT') is not None:
+            use_service_account = os.getenv('USE_SERVICE_ACCOUNT').lower() == 'true'
+        
+        # Reuse the authorized client while its token is still good, as long as
+        # it was built for the requested kind of authentication
+        if self._auth_mode == use_service_account and self._has_fresh_credentials():
+            return True
+        
+        with self._auth_lock:
+            # Another thread may have authenticated while we waited
+            if self._auth_mode == use_service_account and self._has_fresh_credentials():
+                return True
             
-            # First check if service account credentials exist in environment variables
-            service_account_info = os.getenv('GOOGLE_SERVICE_ACCOUNT_INFO')
+            from google.auth.transport.requests import Request
             
-            if use_service_account and service_account_info:
-                # Service Account authentication from environment variable (preferred for production)
+            # Refresh an expiring token in place instead of building a new client
+            if (self._auth_mode == use_service_account and self.client and self.creds
+                    and getattr(self.creds, 'refresh_token', True)):
                 try:
-                    service_account_dict = json.loads(service_account_info)
-                    self.creds = service_account.Credentials.from_service_account_info(
-                        service_account_dict, scopes=self.scopes
-                    )
-                    self.client = gspread.authorize(self.creds)
-                    print("Authenticated with Google Sheets API using service account from environment")
+                    self.creds.refresh(Request())
+                    self._schedule_refresh()
                     return True
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing service account JSON from environment: {e}")
-                    # Fall through to try file-based authentication
+                except Exception as e:
+                    logger.warning("Error refreshing Google Sheets credentials: %s", e)
+            
+            if not self._authenticate(use_service_account):
+                return False
+            self._auth_mode = use_service_account
+            
+            # Fetch the first token now (service accounts start without one) so
+            # the background refresh can be scheduled from its expiry
+            try:
+                if not self.creds.valid:
+                    self.creds.refresh(Request())
+            except Exception as e:
+                logger.warning("Error fetching Google Sheets access token: %s", e)
+            self._schedule_refresh()
+            return True
+    
+    def _schedule_refresh(self) -> None:
+        """
+        Arm a timer that refreshes the token shortly before it expires, so foreground
+        calls never wait on the refresh. Call with _auth_lock held.
+        """
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        
+        expiry = getattr(self.creds, 'expiry', None)
+        if expiry is None:
+            return
+        
+        delay = max(0.0, (expiry - datetime.utcnow()).total_seconds() - TOKEN_REFRESH_MARGIN)
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _background_refresh(self) -> None:
+        """Refresh the token from the timer thread and re-arm the timer"""
+        from google.auth.transport.requests import Request
+        
+        # Holding the auth lock makes callers wait for this refresh rather than start their own
+        with self._auth_lock:
+            # authenticate() may have armed a newer timer while this one waited for the
+            # lock; leave the refresh to that timer rather than run a second chain
+            if self._refresh_timer is not threading.current_thread():
+                return
+            self._refresh_timer = None
+            try:
+                self.creds.refresh(Request())
+            except Exception as e:
+                # authenticate() will retry in the foreground on the next call
+                logger.warning("Background refresh of Google Sheets credentials failed: %s", e)
+                return
+            self._schedule_refresh()
+    
+    def _authorize_client(self):
+        """
+        Build a gspread client whose session keeps connections alive across calls
+        and retries rate-limited or failed requests with backoff.
+        """
+        import gspread
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = AuthorizedSession(self.creds)
+        adapter = HTTPAdapter(
+            pool_connections=SHEETS_POOL_CONNECTIONS,
+            pool_maxsize=SHEETS_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=SHEETS_RETRY_STATUSES)
+        )
+        session.mount("https://", adapter)
+        self.session = session
+        return gspread.Client(self.creds, session=session)
+    
+    def _has_fresh_credentials(self) -> bool:
+        """Check whether the current client's token is valid beyond the refresh margin"""
+        if not self.client or not self.creds:
+            return False
+        expiry = getattr(self.creds, 'expiry', None)
+        if expiry is None:
+            # Not fetched yet; gspread refreshes on first request
+            return True
+        return (expiry - datetime.utcnow()).total_seconds() > TOKEN_REFRESH_MARGIN
+    
+    def _authenticate(self, use_service_account: bool) -> bool:
+        """Build credentials and an authorized gspread client from scratch"""
+        try:
+            from google.oauth2 import service_account
+            from google.oauth2.credentials import Credentials
+            
+            # First check if service account credentials exist in environment variables
+            if use_service_account and _SERVICE_ACCOUNT_INFO:
+                # Service Account authentication from environment variable (preferred for production)
+                self.creds = service_account.Credentials.from_service_account_info(
+                    _SERVICE_ACCOUNT_INFO, scopes=self.service_account_scopes
+                )
+                self.client = self._authorize_client()
+                logger.debug("Authenticated with Google Sheets API using service account from environment")
+                return True
+            elif use_service_account and _SERVICE_ACCOUNT_ERROR:
+                logger.error("Error parsing service account JSON from environment: %s", _SERVICE_ACCOUNT_ERROR)
+                # Fall through to try file-based authentication
                 
             # Fallback to file-based service account if environment variable isn't set
             if use_service_account and os.path.exists(self.service_account_file):
                 # Service Account authentication from file (for development)
                 self.creds = service_account.Credentials.from_service_account_file(
-                    self.service_account_file, scopes=self.scopes
+                    self.service_account_file, scopes=self.service_account_scopes
                 )
-                self.client = gspread.authorize(self.creds)
-                print("Authenticated with Google Sheets API using service account file")
+                self.client = self._authorize_client()
+                logger.debug("Authenticated with Google Sheets API using service account file")
                 return True
                 
             else:
                 # OAuth authentication flow (for user-authenticated access)
                 if os.path.exists(self.oauth_token_file):
-                    self.creds = Credentials.from_authorized_user_info(
-                        json.loads(open(self.oauth_token_file, 'r').read()),
-                        self.scopes
-                    )
+                    with open(self.oauth_token_file, 'rb') as token:
+                        token_info = loads(token.read())
+                    self.creds = Credentials.from_authorized_user_info(token_info, self.scopes)
                 
                 # If credentials don't exist or are invalid, run the OAuth flow
                 if not self.creds or not self.creds.valid:
                     if self.creds and self.creds.expired and self.creds.refresh_token:
+                        from google.auth.transport.requests import Request
                         self.creds.refresh(Request())
                     else:
                         if not os.path.exists(self.oauth_credentials_file):
-                            print("OAuth credentials.json file not found. Please download it from Google Cloud Console.")
+                            logger.error("OAuth credentials.json file not found. Please download it from Google Cloud Console.")
                             return False
-                            
+                        
+                        from google_auth_oauthlib.flow import InstalledAppFlow
                         flow = InstalledAppFlow.from_client_secrets_file(
                             self.oauth_credentials_file, self.scopes
                         )
@@ -111,66 +269,225 @@ class GoogleSheetsService:
                     with open(self.oauth_token_file, 'w') as token:
                         token.write(self.creds.to_json())
                 
-                self.client = gspread.authorize(self.creds)
-                print("Authenticated with Google Sheets API using OAuth")
+                self.client = self._authorize_client()
+                logger.debug("Authenticated with Google Sheets API using OAuth")
                 return True
                 
         except Exception as e:
-            print(f"Error authenticating with Google Sheets API: {str(e)}")
+            logger.error("Error authenticating with Google Sheets API: %s", e)
             return False
     
-    def get_spreadsheet_data(self, spreadsheet_url: str, worksheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_spreadsheet_data(self, spreadsheet_url: str, worksheet_name: Optional[str] = None,
+                             columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Fetch data from a Google Spreadsheet.
         
         Args:
             spreadsheet_url: URL of the Google Spreadsheet
             worksheet_name: Name of the worksheet to fetch (if None, uses first worksheet)
+            columns: Header names to fetch (if None, fetches every column)
             
         Returns:
             List of dictionaries, each representing a row in the spreadsheet
         """
-        if not self.client:
-            if not self.authenticate():
-                print("Failed to authenticate with Google Sheets API")
-                return []
+        if columns:
+            return self._columns_to_records(self.get_spreadsheet_columns(spreadsheet_url, worksheet_name, columns))
+        return self._read_spreadsheet(spreadsheet_url, worksheet_name) or []
+    
+    def get_spreadsheet_columns(self, spreadsheet_url: str, worksheet_name: Optional[str] = None,
+                                columns: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Fetch the named columns of a Google Spreadsheet as parallel lists.
+        
+        Args:
+            spreadsheet_url: URL of the Google Spreadsheet
+            worksheet_name: Name of the worksheet to fetch (if None, uses first worksheet)
+            columns: Header names to fetch; names missing from the sheet are left out
+            
+        Returns:
+            Dictionary mapping each header found to its values, all padded to the same length
+        """
+        return self._read_spreadsheet(spreadsheet_url, worksheet_name, columns or []) or {}
+    
+    def _read_spreadsheet(self, spreadsheet_url: str, worksheet_name: Optional[str] = None,
+                          columns: Optional[List[str]] = None) -> Optional[Any]:
+        """
+        Read a worksheet through the disk cache: every row as a dictionary, or the
+        named columns as lists when columns are given. Returns None on failure.
+        """
+        if not self.authenticate():
+            logger.error("Failed to authenticate with Google Sheets API")
+            return None
+        
+        # Safe to import here: authenticate() has already loaded gspread
+        from gspread.exceptions import SpreadsheetNotFound, NoValidUrlKeyFound, APIError
+        from gspread.utils import extract_id_from_url
         
         try:
+            # Serve from the disk cache if the spreadsheet hasn't changed since it was cached
+            spreadsheet_id = extract_id_from_url(spreadsheet_url)
+            cache_key = f"{'columns' if columns is not None else 'rows'}|{worksheet_name or ''}|{','.join(columns or [])}"
+            modified_time = self._get_modified_time(spreadsheet_id)
+            cache = self._load_sheet_cache(spreadsheet_id)
+            if modified_time and cache.get("modified_time") == modified_time and cache_key in cache["entries"]:
+                data = cache["entries"][cache_key]
+                logger.debug("Loaded %d unchanged rows from spreadsheet cache", self._row_count(data))
+                return data
+            
             # Open the spreadsheet
             spreadsheet = self.client.open_by_url(spreadsheet_url)
             
-            # Get the specified worksheet or default to first
-            if worksheet_name:
-                worksheet = spreadsheet.worksheet(worksheet_name)
+            # Address the worksheet by title in A1 ranges; a named worksheet needs no metadata lookup
+            title = worksheet_name or spreadsheet.sheet1.title
+            
+            # Get just the requested columns if given, otherwise every row as a dictionary
+            if columns is not None:
+                data = self._get_column_values(spreadsheet, title, columns, modified_time)
             else:
-                worksheet = spreadsheet.sheet1
+                data = self._get_all_records(spreadsheet, title)
             
-            # Get all records as dictionaries
-            records = worksheet.get_all_records()
+            logger.debug("Successfully fetched %d rows from Google Spreadsheet", self._row_count(data))
             
-            print(f"Successfully fetched {len(records)} rows from Google Spreadsheet")
-            return records
+            if modified_time:
+                if cache.get("modified_time") != modified_time:
+                    cache = {"modified_time": modified_time, "entries": {}}
+                cache["entries"][cache_key] = data
+                self._save_sheet_cache(spreadsheet_id, cache)
+            return data
             
         except SpreadsheetNotFound:
-            print(f"Error: Spreadsheet not found at URL: {spreadsheet_url}")
-            print("Please check the URL in your .env file")
-            return []
+            logger.error("Spreadsheet not found at URL: %s. Please check the URL in your .env file", spreadsheet_url)
+            return None
         except NoValidUrlKeyFound:
-            print(f"Error: Invalid spreadsheet URL: {spreadsheet_url}")
-            print("Please make sure the URL is correctly formatted")
-            return []
+            logger.error("Invalid spreadsheet URL: %s. Please make sure the URL is correctly formatted", spreadsheet_url)
+            return None
         except APIError as api_error:
             if "The caller does not have permission" in str(api_error):
                 client_email = os.environ.get("GA_CLIENT_EMAIL", "service-account@example.com")
-                print(f"Error: The service account {client_email} doesn't have permission to access this spreadsheet")
-                print(f"Please share your spreadsheet with: {client_email}")
-                print("For help, see docs/spreadsheet_sharing.md")
+                logger.error(
+                    "The service account %s doesn't have permission to access this spreadsheet. "
+                    "Please share your spreadsheet with: %s (for help, see docs/spreadsheet_sharing.md)",
+                    client_email, client_email
+                )
             else:
-                print(f"Google Sheets API Error: {str(api_error)}")
-            return []
+                logger.error("Google Sheets API Error: %s", api_error)
+            return None
+        except Exception as e:
+            logger.error("Error fetching spreadsheet data: %s", e)
+            return None
+    
+    def _get_modified_time(self, spreadsheet_id: str) -> Optional[str]:
+        """
+        Look up the spreadsheet's last modification time with one Drive metadata call.
+        Returns None if it can't be determined (e.g. OAuth tokens without Drive scope).
+        """
+        try:
+            response = self.session.get(
+                DRIVE_FILES_URL.format(file_id=spreadsheet_id),
+                params={"fields": "modifiedTime", "supportsAllDrives": "true"},
+                timeout=10
+            )
+            if response.status_code != 200:
+                return None
+            return response.json().get("modifiedTime")
         except Exception as e:
-            print(f"Error fetching spreadsheet data: {str(e)}")
+            logger.warning("Could not check spreadsheet modification time: %s", e)
+            return None
+    
+    def _sheet_cache_path(self, spreadsheet_id: str) -> str:
+        return os.path.join(self.cache_dir, f"sheet_{spreadsheet_id}.json")
+    
+    def _load_sheet_cache(self, spreadsheet_id: str) -> Dict[str, Any]:
+        """Load the cached records for a spreadsheet, or an empty cache"""
+        try:
+            with open(self._sheet_cache_path(spreadsheet_id), 'rb') as f:
+                cache = loads(f.read())
+            if isinstance(cache, dict) and isinstance(cache.get("entries"), dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {"modified_time": None, "entries": {}}
+    
+    def _save_sheet_cache(self, spreadsheet_id: str, cache: Dict[str, Any]) -> None:
+        """Write the spreadsheet cache atomically so readers never see a partial file"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = self._sheet_cache_path(spreadsheet_id)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps_bytes(cache, indent=False))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Error saving spreadsheet cache: %s", e)
+    
+    @staticmethod
+    def _a1_range(title: str, cells: str = "") -> str:
+        """Build an A1 range on the named worksheet (the whole sheet if no cells are given)"""
+        quoted = "'" + title.replace("'", "''") + "'"
+        return f"{quoted}!{cells}" if cells else quoted
+    
+    def _get_all_records(self, spreadsheet, title: str) -> List[Dict[str, Any]]:
+        """
+        Fetch a whole worksheet with one values.batchGet call and zip the rows
+        into dictionaries keyed by the header row. Short rows are padded with "".
+        """
+        value_range = spreadsheet.values_batch_get([self._a1_range(title)])["valueRanges"][0]
+        rows = value_range.get("values", [])
+        if not rows:
             return []
+        
+        headers = rows[0]
+        width = len(headers)
+        return [dict(zip(headers, row + [""] * (width - len(row)))) for row in rows[1:]]
+    
+    def _get_column_values(self, spreadsheet, title: str, columns: List[str],
+                           modified_time: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Fetch only the named columns of a worksheet as lists padded to the same length.
+        Uses one call for the header row and one batchGet for the column values; the
+        header row is reused while the spreadsheet's modified_time is unchanged.
+        Columns missing from the header row are left out.
+        """
+        from gspread.utils import rowcol_to_a1
+        
+        header_key = (spreadsheet.id, title)
+        cached = self._headers_cache.get(header_key)
+        if modified_time and cached and cached[0] == modified_time:
+            headers = cached[1]
+        else:
+            header_range = spreadsheet.values_get(self._a1_range(title, "1:1"))
+            headers = header_range.get("values", [[]])[0]
+            if modified_time:
+                self._headers_cache[header_key] = (modified_time, headers)
+        
+        present = [(name, headers.index(name) + 1) for name in columns if name in headers]
+        if not present:
+            return {}
+        
+        ranges = []
+        for _, col in present:
+            letter = rowcol_to_a1(1, col).rstrip('0123456789')
+            ranges.append(self._a1_range(title, f"{letter}2:{letter}"))
+        
+        # Column-major results give each range as a single list, with trailing blanks trimmed
+        result = spreadsheet.values_batch_get(ranges, params={"majorDimension": "COLUMNS"})
+        column_values = [value_range.get("values", [[]])[0] for value_range in result["valueRanges"]]
+        row_count = max((len(values) for values in column_values), default=0)
+        
+        return {name: values + [""] * (row_count - len(values)) for (name, _), values in zip(present, column_values)}
+    
+    @staticmethod
+    def _columns_to_records(columns: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Zip parallel column lists back into row dictionaries"""
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+    
+    @staticmethod
+    def _row_count(data: Any) -> int:
+        """Number of rows in a list of records or a dictionary of padded columns"""
+        if isinstance(data, dict):
+            return len(next(iter(data.values()), []))
+        return len(data)
     
     def fetch_affiliate_products(self, spreadsheet_url: str, worksheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -182,44 +499,95 @@ class GoogleSheetsService:
             
         Returns:
             List of affiliate product dictionaries
-        """        
-        # Fetch raw spreadsheet data
-        raw_products = self.get_spreadsheet_data(spreadsheet_url, worksheet_name)
+        """
+        # Products read within the last few minutes are reused without touching the API
+        key = (spreadsheet_url, worksheet_name)
+        with self._products_cache_lock:
+            cached = self._products_cache.get(key)
+        if cached and time.monotonic() - cached[0] < PRODUCTS_CACHE_TTL:
+            # Copies, so callers can't modify the cached products
+            return copy.deepcopy(cached[1])
+        
+        products = self._fetch_affiliate_products(spreadsheet_url, worksheet_name)
+        if products:
+            with self._products_cache_lock:
+                self._products_cache[key] = (time.monotonic(), copy.deepcopy(products))
+        return products
+    
+    def flush_cache(self) -> None:
+        """Forget cached affiliate products so the next fetch reads the spreadsheet"""
+        with self._products_cache_lock:
+            self._products_cache.clear()
+    
+    def _fetch_affiliate_products(self, spreadsheet_url: str, worksheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Read and format affiliate products from the spreadsheet, without the in-memory cache"""
+        # Fetch the product columns as parallel lists
+        columns = self.get_spreadsheet_columns(spreadsheet_url, worksheet_name, AFFILIATE_COLUMNS)
+        row_count = self._row_count(columns)
         
-        if not raw_products:
-            print("No products found in spreadsheet. Returning empty list.")
+        if not row_count:
+            logger.warning("No products found in spreadsheet. Returning empty list.")
             return []
         
-        # Format the products based on the spreadsheet structure
-        formatted_products = []
-        
-        for row in raw_products:            # Check if Affiliate Links column exists - this is our minimal requirement
-            if 'Affiliate Links' in row and row['Affiliate Links'].strip():
-                # Create a product with URL and image URL if available
-                product = {
-                    "url": row['Affiliate Links'].strip(),
-                    "product_name": f"Product {len(formatted_products)+1}",  # Default name
-                    "description": "",  # Empty description
-                    "price": "",  # Empty price
-                    "image_url": row.get('Image URL', '')  # Get image URL from spreadsheet
-                }
-                formatted_products.append(product)
-            # Also check for singular form as fallback
-            elif 'Affiliate Link' in row and row['Affiliate Link'].strip():
-                product = {
-                    "url": row['Affiliate Link'].strip(),
-                    "product_name": row.get('Product Name', f"Product {len(formatted_products)+1}"),
-                    "description": row.get('Description', ''),
-                    "price": row.get('Price', ''),
-                    "image_url": row.get('Image URL', '')  # Get image URL from spreadsheet
+        has_plural = 'Affiliate Links' in columns
+        has_singular = 'Affiliate Link' in columns
+        if not (has_plural or has_singular):
+            logger.warning("No affiliate link column found in spreadsheet. Returning empty list.")
+            return []
+        
+        blank = [""] * row_count
+        image_urls = columns.get('Image URL', blank)  # Get image URL from spreadsheet
+        names = columns.get('Product Name')
+        descriptions = columns.get('Description', blank)
+        prices = columns.get('Price', blank)
+        
+        if has_plural and has_singular:
+            # "Affiliate Links" is our minimal requirement; rows where it is blank fall
+            # back to the singular form, which carries the full product details
+            formatted_products = []
+            for i, (url, single_url) in enumerate(zip(columns['Affiliate Links'], columns['Affiliate Link'])):
+                url = url.strip()
+                if url:
+                    formatted_products.append({
+                        "url": url,
+                        "product_name": f"Product {len(formatted_products) + 1}",  # Default name
+                        "description": "",
+                        "price": "",
+                        "image_url": image_urls[i]
+                    })
+                elif single_url.strip():
+                    formatted_products.append({
+                        "url": single_url.strip(),
+                        "product_name": names[i] if names is not None else f"Product {len(formatted_products) + 1}",
+                        "description": descriptions[i],
+                        "price": prices[i],
+                        "image_url": image_urls[i]
+                    })
+        else:
+            # With a single link column it can be picked once for the whole sheet
+            urls = [url.strip() for url in columns['Affiliate Links' if has_plural else 'Affiliate Link']]
+            if has_plural:
+                # Sheets with the plural column only carry links and images
+                names, descriptions, prices = None, blank, blank
+            
+            # Format the products based on the spreadsheet structure
+            linked_rows = [i for i, url in enumerate(urls) if url]
+            formatted_products = [
+                {
+                    "url": urls[i],
+                    "product_name": names[i] if names is not None else f"Product {n}",  # Default name
+                    "description": descriptions[i],
+                    "price": prices[i],
+                    "image_url": image_urls[i]
                 }
-                formatted_products.append(product)
+                for n, i in enumerate(linked_rows, 1)
+            ]
         
-        print(f"Formatted {len(formatted_products)} affiliate products from spreadsheet")
+        logger.debug("Formatted %d affiliate products from spreadsheet", len(formatted_products))
         
         # If no valid products were found, return empty list
         if not formatted_products:
-            print("No valid products found in spreadsheet. Returning empty list.")
+            logger.warning("No valid products found in spreadsheet. Returning empty list.")
             return []
             
         return formatted_products
@@ -1,25 +1,101 @@
 import os
-import json
+import time
+import logging
+import sqlite3
+import threading
 from typing import Dict, Optional, List
-from dotenv import load_dotenv
+from helpers.env_utils import load_env
 from datetime import datetime
+from helpers.json_utils import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
+load_env()
+
+# Log directory, created once per process rather than on every instantiation
+_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+os.makedirs(_LOG_DIR, exist_ok=True)
+# SQLite store for share attempts: appends are a single insert and platform lookups use an index
+_SHARING_DB = os.path.join(_LOG_DIR, "social_sharing.db")
+# Earlier share logs, imported once when the database is first created:
+# a JSON array (oldest format) and then one JSON object per line
+_LEGACY_LOGS = [os.path.join(_LOG_DIR, "social_sharing.json"), os.path.join(_LOG_DIR, "social_sharing.jsonl")]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shares (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS share_platforms (
+    share_id INTEGER NOT NULL REFERENCES shares(id),
+    platform TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_share_platforms ON share_platforms(platform, share_id);
+"""
 
 class SocialService:
     """Service that logs social sharing attempts (all sharing functionality disabled)"""
     
     def __init__(self):
-        # Create log directory
-        self.log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
-        os.makedirs(self.log_dir, exist_ok=True)
-        self.sharing_log = os.path.join(self.log_dir, "social_sharing.json")
+        self.log_dir = _LOG_DIR
+        self.sharing_log = _SHARING_DB
+        
+        # Opened on first use, shared by all threads behind a lock
+        self._conn = None
+        self._conn_lock = threading.Lock()
         
         # Log startup
-        print("Social Service initialized (all sharing disabled)")
+        logger.debug("Social Service initialized (all sharing disabled)")
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the sharing database and create its tables on first use (call with _conn_lock held)"""
+        if self._conn is None:
+            created = not os.path.exists(self.sharing_log)
+            conn = sqlite3.connect(self.sharing_log, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            if created:
+                self._import_legacy_logs(conn)
+            self._conn = conn
+        return self._conn
+    
+    def _import_legacy_logs(self, conn: sqlite3.Connection) -> None:
+        """Copy share attempts from the old JSON/JSON-lines logs into a new database"""
+        entries = []
+        for path in _LEGACY_LOGS:
+            try:
+                with open(path, 'rb') as f:
+                    if path.endswith(".jsonl"):
+                        entries.extend(loads(line) for line in f if line.strip())
+                    else:
+                        entries.extend(loads(f.read()))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping unreadable share log %s: %s", path, e)
+        # Anything that isn't a logged share object is skipped
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        if not entries:
+            return
+        
+        with conn:
+            conn.execute("BEGIN")
+            for entry in entries:
+                try:
+                    ts = datetime.fromisoformat(entry["timestamp"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    ts = 0.0
+                share_id = conn.execute(
+                    "INSERT INTO shares (ts, payload) VALUES (?, ?)", (ts, dumps_bytes(entry, indent=False))
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO share_platforms (share_id, platform) VALUES (?, ?)",
+                    [(share_id, platform) for platform in entry.get("platforms_attempted") or []]
+                )
+        logger.debug("Imported %d share attempts from the old share logs", len(entries))
     
     def share_across_platforms(self, message: str, link: Optional[str] = None, platforms: List[str] = None) -> Dict:
         """
@@ -47,47 +123,55 @@ class SocialService:
         self._log_share(result)
         
         # Print a notification
-        print("[DISABLED] Social sharing attempted but is completely disabled")
+        logger.warning("[DISABLED] Social sharing attempted but is completely disabled")
         
         return {"disabled": result}
     
     def _log_share(self, share_data: Dict) -> None:
-        """Log a social media share attempt to a file"""
+        """Log a social media share attempt to the sharing database"""
         try:
-            # Load existing logs
-            logs = []
-            if os.path.exists(self.sharing_log):
-                with open(self.sharing_log, 'r') as f:
-                    logs = json.load(f)
-            
-            # Add new log entry
-            logs.append(share_data)
-            
-            # Save logs
-            with open(self.sharing_log, 'w') as f:
-                json.dump(logs, f, indent=2)
+            payload = dumps_bytes(share_data, indent=False)
+            platforms = share_data.get("platforms_attempted") or []
+            with self._conn_lock:
+                conn = self._get_connection()
+                with conn:
+                    conn.execute("BEGIN")
+                    share_id = conn.execute(
+                        "INSERT INTO shares (ts, payload) VALUES (?, ?)", (time.time(), payload)
+                    ).lastrowid
+                    conn.executemany(
+                        "INSERT INTO share_platforms (share_id, platform) VALUES (?, ?)",
+                        [(share_id, platform) for platform in platforms]
+                    )
                 
         except Exception as e:
-            print(f"Error logging social share attempt: {str(e)}")
+            logger.warning("Error logging social share attempt: %s", e)
     
     def get_share_history(self, platform: Optional[str] = None, limit: int = 20) -> List[Dict]:
         """Get history of social media share attempts"""
         try:
-            if not os.path.exists(self.sharing_log):
+            if limit <= 0:
                 return []
-                
-            with open(self.sharing_log, 'r') as f:
-                logs = json.load(f)
             
-            # Filter by platform if specified (though all are disabled now)
-            if platform:
-                logs = [log for log in logs if log.get("platforms_attempted") and platform in log.get("platforms_attempted", [])]
-                
-            # Return most recent logs
-            return logs[-limit:]
+            with self._conn_lock:
+                conn = self._get_connection()
+                # Filter by platform if specified (though all are disabled now)
+                if platform:
+                    rows = conn.execute(
+                        "SELECT s.payload FROM share_platforms p JOIN shares s ON s.id = p.share_id "
+                        "WHERE p.platform = ? ORDER BY p.share_id DESC LIMIT ?",
+                        (platform, limit)
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        "SELECT payload FROM shares ORDER BY id DESC LIMIT ?", (limit,)
+                    ).fetchall()
+            
+            # Return most recent logs, oldest first
+            return [loads(payload) for (payload,) in reversed(rows)]
             
         except Exception as e:
-            print(f"Error getting share history: {str(e)}")
+            logger.warning("Error getting share history: %s", e)
             return []
 
 # Create singleton instance
@@ -2,33 +2,108 @@
 Service to detect trending topics for automatic blog generation
 """
 import requests
-import json
+import bisect
 import os
 import random
-from datetime import datetime, timedelta
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
+from helpers.env_utils import load_env
+from helpers.json_utils import dumps_bytes, loads
+
+try:
+    import ijson
+    try:
+        # The C backend is several times faster than the pure-Python default
+        ijson = ijson.get_backend('yajl2_c')
+    except ImportError:
+        pass
+except ImportError:  # ijson is optional; fall back to parsing the whole response
+    ijson = None
 
 # Load environment variables if not already loaded
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
+load_env()
+
+# Trend cache directory, created once per process rather than on every instantiation
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+os.makedirs(_CACHE_DIR, exist_ok=True)
+
+# (connect, read) timeout for News API and Google Trends requests
+_REQUEST_TIMEOUT = (3, 10)
+
+# Seconds a cache file's contents are kept in memory before the file is read again
+_MEM_CACHE_TTL = 60
+
+# get_trending_topics stops waiting for slower categories once it has this many
+# candidates per requested topic, enough for the random pick to stay varied.
+# With several categories each one supplies at most `count` candidates, so no
+# single category can fill the pool on its own.
+_TOPIC_OVERSAMPLE = 3
+
+# Google Trends prefixes its JSON with ")]}'," to prevent JSON hijacking
+_TRENDS_PREFIX_LENGTH = 5
+
+class _DecodedBody:
+    """
+    File-like reader over a streamed response's decompressed body, for ijson.
+    Reads go through iter_content because urllib3 1.x's raw.read(n) counts
+    compressed bytes and can return b'' before the end of a gzipped body.
+    The first `skip` decoded bytes are dropped.
+    """
+    def __init__(self, response, skip=0):
+        self._chunks = response.iter_content(chunk_size=65536)
+        self._buffer = b""
+        self._skip = skip
+    
+    def read(self, size=-1):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            if self._skip:
+                dropped = min(self._skip, len(chunk))
+                chunk = chunk[dropped:]
+                self._skip -= dropped
+            self._buffer = chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
 class TrendService:
     """Service to detect trending topics for blog generation"""
-      def __init__(self):
+    def __init__(self):
         self.google_trends_api_url = "https://trends.google.com/trends/api/dailytrends"
         self.news_api_url = "https://newsapi.org/v2/top-headlines"
         self.news_api_key = os.environ.get("NEWS_API_KEY", "YOUR_NEWS_API_KEY")
         
-        # Create a cache directory to store trend data
-        self.cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Pooled session so category fetches reuse TCP/TLS connections across calls.
+        # Transient failures are retried with a short backoff; once retries run out the
+        # last response is returned (not raised) so News API error messages still surface
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.2,
+                                                status_forcelist=(429, 500, 502, 503, 504),
+                                                raise_on_status=False))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Directory to store trend data
+        self.cache_dir = _CACHE_DIR
         
         # Define cache files
         self.google_trends_cache = os.path.join(self.cache_dir, "google_trends.json")
         self.news_cache = os.path.join(self.cache_dir, "news_trends.json")
         
+        # cache_file -> (loaded_at monotonic, entry dict), in front of the disk cache
+        self._mem_cache = {}
+        self._mem_cache_lock = threading.Lock()
+        
         # List of terms that suggest news about people
         self.people_indicators = [
             "says", "said", "claimed", "announced", "revealed", "confirms", 
@@ -44,6 +119,17 @@ class TrendService:
                             "Harris", "Johnson", "Smith", "Williams", "Brown", "Jones",
                             "Miller", "Davis", "Dimon", "Cook", "Nadella", "Pichai"]
         
+        # Common patterns that suggest quotes or statements. The third entry is a
+        # triple-quoted ", " (not a pair of quote characters), kept as it has always matched
+        self.quote_patterns = ["'s ", " says", "'", """, """, "says", "said"]
+        
+        # All of the above as one case-insensitive alternation, so each article is
+        # scanned once by the regex engine instead of once per term
+        self._person_re = re.compile(
+            "|".join(re.escape(term.lower()) for term in self.common_names + self.people_indicators + self.quote_patterns),
+            re.IGNORECASE
+        )
+        
     def get_google_trends(self, geo="US") -> List[Dict]:
         """Fetch trending searches from Google Trends with caching"""
         # Check for cached data first (not older than 6 hours)
@@ -57,14 +143,29 @@ class TrendService:
             "ns": 15
         }
         
+        # An expired entry still lets the server answer 304 if nothing changed
+        expired = self._load_cache_entry(self.google_trends_cache)
+        
         try:
-            response = requests.get(self.google_trends_api_url, params=params)
+            response = self.session.get(self.google_trends_api_url, params=params,
+                                        headers=self._conditional_headers(expired),
+                                        timeout=_REQUEST_TIMEOUT, stream=ijson is not None)
+            if response.status_code == 304 and expired:
+                response.close()
+                return self._renew_cached_data(self.google_trends_cache, expired)
+            
             # Google Trends API returns a strange prefix before the JSON data
-            json_data = response.text[5:]  # Remove ")]}'"
-            data = json.loads(json_data)
+            if ijson is not None:
+                # Parse one day at a time straight off the socket instead of
+                # building the whole response body and dict tree first
+                body = _DecodedBody(response, skip=_TRENDS_PREFIX_LENGTH)
+                trend_days = ijson.items(body, 'default.trendingSearchesDays.item')
+            else:
+                data = loads(response.content[_TRENDS_PREFIX_LENGTH:])
+                trend_days = data.get("default", {}).get("trendingSearchesDays", [])
             
             trending_searches = []
-            for trend_day in data.get("default", {}).get("trendingSearchesDays", []):
+            for trend_day in trend_days:
                 date = trend_day.get("date", "")
                 for trend in trend_day.get("trendingSearches", []):
                     title = trend.get("title", {}).get("query", "")
@@ -79,7 +180,8 @@ class TrendService:
                     })
             
             # Save to cache
-            self._save_cached_data(self.google_trends_cache, trending_searches)
+            self._save_cached_data(self.google_trends_cache, trending_searches,
+                                   response.headers.get("ETag"), response.headers.get("Last-Modified"))
             
             return trending_searches
             
@@ -118,11 +220,19 @@ class TrendService:
         if category:
             params["category"] = category
         
+        # An expired entry still lets the server answer 304 if nothing changed
+        expired = self._load_cache_entry(news_cache_file)
+        
         try:
-            response = requests.get(self.news_api_url, params=params)
-            data = response.json()
+            response = self.session.get(self.news_api_url, params=params,
+                                        headers=self._conditional_headers(expired),
+                                        timeout=_REQUEST_TIMEOUT, stream=ijson is not None)
+            if response.status_code == 304 and expired:
+                response.close()
+                return self._renew_cached_data(news_cache_file, expired)
             
             if response.status_code != 200:
+                data = response.json()
                 print(f"News API Error: {data.get('message', '')}")
                 # Try to use cached data regardless of age in case of error
                 cached_data = self._load_cached_data(news_cache_file, max_age_hours=24)
@@ -130,18 +240,27 @@ class TrendService:
                     return cached_data
                 return []
             
-            headlines = []
-            for article in data.get("articles", []):
-                headlines.append({
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "source": article.get("source", {}).get("name", ""),
+            if ijson is not None:
+                # Stream the articles, skipping the response metadata and unused article fields
+                articles = ijson.items(_DecodedBody(response), 'articles.item')
+            else:
+                articles = loads(response.content).get("articles", [])
+            
+            headlines = [
+                {
+                    # NewsAPI sends null for missing fields; store strings so callers needn't check
+                    "title": article.get("title") or "",
+                    "description": article.get("description") or "",
+                    "source": (article.get("source") or {}).get("name", ""),
                     "url": article.get("url", ""),
                     "publishedAt": article.get("publishedAt", "")
-                })
+                }
+                for article in articles
+            ]
             
             # Cache the results
-            self._save_cached_data(news_cache_file, headlines)
+            self._save_cached_data(news_cache_file, headlines,
+                                   response.headers.get("ETag"), response.headers.get("Last-Modified"))
             
             return headlines
         
@@ -153,32 +272,84 @@ class TrendService:
                 return cached_data
             return []
     
-    def _load_cached_data(self, cache_file: str, max_age_hours: int = 6) -> Optional[List[Dict]]:
-        """Load cached data if it's not too old"""
-        if not os.path.exists(cache_file):
-            return None
-            
+    def _load_cache_entry(self, cache_file: str) -> Optional[Dict]:
+        """
+        Load a cache entry {data, fetched_at, etag, last_modified} regardless of age.
+        Entries loaded or saved within the last minute are served from memory.
+        """
+        with self._mem_cache_lock:
+            entry = self._mem_cache.get(cache_file)
+        if entry and time.monotonic() - entry[0] < _MEM_CACHE_TTL:
+            return entry[1]
+        
         try:
-            file_mtime = datetime.fromtimestamp(os.path.getmtime(cache_file))
-            # Check if file is too old
-            if datetime.now() - file_mtime > timedelta(hours=max_age_hours):
-                return None
-                
-            with open(cache_file, 'r') as f:
-                return json.load(f)
+            # Open directly rather than checking existence first: one syscall fewer per miss
+            with open(cache_file, 'rb') as f:
+                cached = loads(f.read())
+                if isinstance(cached, list):
+                    # Cache files written before validators were stored hold just the data
+                    cached = {"data": cached, "fetched_at": os.fstat(f.fileno()).st_mtime}
+            with self._mem_cache_lock:
+                self._mem_cache[cache_file] = (time.monotonic(), cached)
+            return cached
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading cached data: {e}")
             return None
     
-    def _save_cached_data(self, cache_file: str, data: List[Dict]) -> bool:
-        """Save data to cache file"""
+    def _load_cached_data(self, cache_file: str, max_age_hours: int = 6) -> Optional[List[Dict]]:
+        """Load cached data if it's not too old"""
+        cached = self._load_cache_entry(cache_file)
+        # Check if the entry is too old
+        if not cached or time.time() - cached.get("fetched_at", 0) > max_age_hours * 3600:
+            return None
+        return cached.get("data")
+    
+    def _save_cached_data(self, cache_file: str, data: List[Dict],
+                          etag: Optional[str] = None, last_modified: Optional[str] = None) -> bool:
+        """Save data to cache file, with the response validators used for conditional refreshes"""
+        cached = {
+            "data": data,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified
+        }
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a unique temp file and swap it in, so a concurrent reader never
+            # sees a partial file (mkstemp rather than a pid suffix: category fetches
+            # run on several threads of the same process)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.cache.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumps_bytes(cached, indent=False))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            # Keep the fresh entry in memory so the next read doesn't reload the file
+            with self._mem_cache_lock:
+                self._mem_cache[cache_file] = (time.monotonic(), cached)
             return True
         except Exception as e:
             print(f"Error saving cache: {e}")
             return False
+    
+    @staticmethod
+    def _conditional_headers(cached: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from an expired cache entry"""
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+    
+    def _renew_cached_data(self, cache_file: str, cached: Dict) -> List[Dict]:
+        """Mark an entry the server reported as unchanged (304) as freshly fetched"""
+        self._save_cached_data(cache_file, cached["data"], cached.get("etag"), cached.get("last_modified"))
+        return cached["data"]
             
     def _is_about_person(self, title: str, description: str = "") -> bool:
         """
@@ -191,32 +362,32 @@ class TrendService:
         Returns:
             True if the article appears to be primarily about a person
         """
-        # Ensure title and description are strings
-        title = str(title) if title is not None else ""
-        description = str(description) if description is not None else ""
-        
-        # Combine title and description for analysis
-        full_text = (title + " " + description).lower()
-        
-        # Check for names of prominent people
-        for name in self.common_names:
-            if name.lower() in full_text:
-                return True
-        
-        # Check for verbs and patterns that suggest people-focused content
-        for indicator in self.people_indicators:
-            if indicator.lower() in full_text:
-                return True
+        # Check the combined title and description for names of prominent people,
+        # verbs that suggest people-focused content, and quote patterns in one pass
+        return self._person_re.search(title + " " + description) is not None
+    
+    def _people_flags(self, texts: List[str]) -> List[bool]:
+        """
+        Batch version of _is_about_person: flag which of the given texts are about people
         
-        # Check for common patterns that suggest quotes or statements
-        quote_patterns = ["'s ", " says", "'", """, """, "says", "said"]
-        for pattern in quote_patterns:
-            if pattern in full_text:
-                return True
+        The texts are joined with a unit separator (which no pattern contains, so a
+        match never spans two texts) and scanned with a single finditer; each match
+        is mapped back to its text by bisecting the start offsets.
+        """
+        flags = [False] * len(texts)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
         
-        return False
+        blob = "\x1f".join(texts)
+        for match in self._person_re.finditer(blob):
+            flags[bisect.bisect_right(starts, match.start()) - 1] = True
+        return flags
     
-    def get_trending_topics(self, sources=["news"], count=5, categories=None, filter_people=True) -> List[Dict]:
+    def get_trending_topics(self, sources=["news"], count=5, categories=None, filter_people=True,
+                            rng: Optional[random.Random] = None) -> List[Dict]:
         """
         Get trending topics from multiple sources
         
@@ -225,6 +396,7 @@ class TrendService:
             count: Number of trends to return
             categories: Optional list of news categories to include
             filter_people: Whether to filter out news primarily about people
+            rng: Optional random.Random to make the selection reproducible (e.g. in tests)
             
         Returns:
             List of trending topics
@@ -234,31 +406,46 @@ class TrendService:
         if "news" in sources:
             # Use specified categories or default to a variety
             news_categories = categories or ["technology", "business", "science", "health"]
-            for category in news_categories:
-                news_trends = self.get_news_headlines(category=category)
-                for headline in news_trends:
-                    # Skip news about people if filter is enabled
-                    if filter_people and self._is_about_person(
-                        headline["title"], 
-                        headline.get("description", "")
-                    ):
-                        continue
-                        
-                    all_trends.append({
-                        "source": "news",
-                        "topic": headline["title"],
-                        "category": category,
-                        "description": headline.get("description", ""),
-                        "news_source": headline.get("source", ""),
-                        "url": headline.get("url", ""),
-                        "publishedAt": headline.get("publishedAt", "")
-                    })
-        
-        # Randomize to avoid always getting the same topics
-        random.shuffle(all_trends)
+            per_category = count if len(news_categories) > 1 else None
+            
+            # Fetch every category at once and use them as they arrive, so the wait is
+            # for the first few responses rather than the slowest one
+            executor = ThreadPoolExecutor(max_workers=len(news_categories))
+            futures = {executor.submit(self.get_news_headlines, category=category): category
+                       for category in news_categories}
+            try:
+                for future in as_completed(futures):
+                    category = futures[future]
+                    # Caches written before headlines were normalized may still hold nulls
+                    headlines = [
+                        (headline, headline["title"] or "", headline.get("description") or "")
+                        for headline in future.result()
+                    ]
+                    
+                    # Skip news about people if filter is enabled, checking the batch in one regex scan
+                    if filter_people:
+                        about_people = self._people_flags([title + " " + description for _, title, description in headlines])
+                        headlines = [row for row, is_person in zip(headlines, about_people) if not is_person]
+                    
+                    for headline, title, description in headlines[:per_category]:
+                        all_trends.append({
+                            "source": "news",
+                            "topic": title,
+                            "category": category,
+                            "description": description,
+                            "news_source": headline.get("source", ""),
+                            "url": headline.get("url", ""),
+                            "publishedAt": headline.get("publishedAt", "")
+                        })
+                    
+                    if len(all_trends) >= count * _TOPIC_OVERSAMPLE:
+                        break
+            finally:
+                # Fetches still in flight finish in the background and refresh their caches
+                executor.shutdown(wait=False, cancel_futures=True)
         
-        # Return the top trends
-        return all_trends[:count]
+        # Pick a random selection to avoid always getting the same topics
+        return (rng or random).sample(all_trends, min(count, len(all_trends)))
     
     def generate_blog_topic(self, trend: Dict) -> str:
         """Convert a trend into a blog topic prompt with enhanced context"""
@@ -278,20 +465,14 @@ class TrendService:
             description = trend.get("description", "")
             news_source = trend.get("news_source", "")
             
-            prompt = f"Write a comprehensive blog post analyzing the recent news: {topic}"
-            
-            if description:
-                prompt += f". Context: {description}"
-            
-            if category:
-                prompt += f". This is trending in the {category} category"
-                
-            if news_source:
-                prompt += f" and was reported by {news_source}"
-                
-            prompt += ". Include facts, analysis, and your own insights while maintaining journalistic integrity."
+            # Optional clauses are resolved first so the prompt is built in one formatting step
+            context_clause = f". Context: {description}" if description else ""
+            category_clause = f". This is trending in the {category} category" if category else ""
+            source_clause = f" and was reported by {news_source}" if news_source else ""
             
-            return prompt
+            return (f"Write a comprehensive blog post analyzing the recent news: {topic}"
+                    f"{context_clause}{category_clause}{source_clause}. "
+                    "Include facts, analysis, and your own insights while maintaining journalistic integrity.")
         
         else:
             return f"Write a blog post about the trending topic: {topic}. Make it informative, SEO-friendly, and engaging for readers interested in this subject."
@@ -38,17 +38,10 @@ def run_tests():
             # Import the test module
             module = importlib.import_module(f"tests.{test_module}")
             
-            # Get the main test function
-            test_function_name = test_module
-            if hasattr(module, test_function_name):
-                test_function = getattr(module, test_function_name)
-            else:
-                # Try alternative naming
-                test_function_name = f"{test_module.replace('test_', '')}"
-                if hasattr(module, test_function_name):
-                    test_function = getattr(module, test_function_name)
-                else:
-                    raise AttributeError(f"Could not find test function in {test_module}")
+            # Get the main test function, named after the module or without its test_ prefix
+            test_function = getattr(module, test_module, None) or getattr(module, test_module.replace('test_', ''), None)
+            if test_function is None:
+                raise AttributeError(f"Could not find test function in {test_module}")
             
             # Run the test and record result
             start_time = time.time()
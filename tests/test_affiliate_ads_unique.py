@@ -16,8 +16,12 @@ project_dir = os.path.dirname(current_dir)  # Go up one level to project root
 sys.path.append(project_dir)
 
 # Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from helpers.env_utils import load_env
+load_env()
+
+# Patterns for pulling the inserted ads back out of the generated HTML
+_URL_RE = re.compile(r'href="([^"]+)"[^>]*>Shop Now</a>')
+_NAME_RE = re.compile(r'<div[^>]*class="product-catchphrase"[^>]*>([^<]+)</div>')
 
 def test_unique_affiliate_ads():
     """
@@ -64,8 +68,8 @@ def test_unique_affiliate_ads():
     )
     
     # Extract the products that were inserted
-    product_urls = re.findall(r'href="([^"]+)"[^>]*>Shop Now</a>', result_content)
-    product_names = re.findall(r'<div[^>]*class="product-catchphrase"[^>]*>([^<]+)</div>', result_content)
+    product_urls = _URL_RE.findall(result_content)
+    product_names = _NAME_RE.findall(result_content)
     
     # Count the number of ads actually inserted
     num_ads_inserted = len(product_urls)
@@ -5,7 +5,6 @@ and fetch affiliate product data.
 """
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14,9 +13,10 @@ sys.path.append(project_dir)
 
 # Now import services after adjusting path
 from services.sheets_service import google_sheets_service
+from helpers.env_utils import load_env
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 def test_spreadsheet_access():
     """Test if we can access the spreadsheet and fetch data."""
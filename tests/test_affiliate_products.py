@@ -9,20 +9,20 @@ import sys
 import json
 from pprint import pprint
 from datetime import datetime
-from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 # Load environment variables
-load_dotenv()
+from helpers.env_utils import load_env
+load_env()
+
+from services.ad_service import ad_service
+from services.sheets_service import google_sheets_service
 
 def test_affiliate_products():
     """Test fetching and integrating affiliate products from the Google Sheet"""
-    from services.ad_service import ad_service
-    from services.sheets_service import google_sheets_service
-    
     print("=" * 80)
     print("AFFILIATE PRODUCT INTEGRATION TEST")
     print("=" * 80)
@@ -110,8 +110,8 @@ def test_affiliate_products():
     os.makedirs(output_dir, exist_ok=True)
     
     output_file = os.path.join(output_dir, "affiliate_test_output.html")
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    page_header = f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -119,31 +119,33 @@ def test_affiliate_products():
             <meta charset="utf-8">
             <meta name="viewport" content="width=device-width, initial-scale=1">
             <style>
-                body { 
+                body {{ 
                     font-family: Arial, sans-serif; 
                     line-height: 1.6; 
                     max-width: 800px; 
                     margin: 0 auto; 
                     padding: 20px;
-                }
-                h1 { color: #333; }
-                .test-info { background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+                }}
+                h1 {{ color: #333; }}
+                .test-info {{ background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
             </style>
         </head>
         <body>
             <div class="test-info">
                 <h2>Affiliate Product Integration Test</h2>
-                <p>Timestamp: """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """</p>
-                <p>Products fetched: """ + str(len(affiliate_products)) + """</p>
+                <p>Timestamp: {timestamp}</p>
+                <p>Products fetched: {len(affiliate_products)}</p>
             </div>
             <hr>
             <h3>Blog Content with Affiliate Products:</h3>
-        """)
-        f.write(content_with_affiliates)
-        f.write("""
+        """
+    page_footer = """
         </body>
         </html>
-        """)
+        """
+    # Assemble the page once and write it in a single call
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("".join((page_header, content_with_affiliates, page_footer)))
     
     print(f"✅ Test complete! Output saved to: {output_file}")
     print(f"Open this file in a browser to view the affiliate product integration.")
@@ -7,7 +7,7 @@ This will:
 
 import os
 import sys
-import json
+import time
 from datetime import datetime
 
 # Add the parent directory to sys.path to allow importing from services
@@ -17,6 +17,7 @@ if parent_dir not in sys.path:
 
 # Import the image service
 from services.image_service import image_service
+from helpers.json_utils import dumps_bytes, loads
 
 def test_image_service():
     print("Testing Image Service...")
@@ -36,11 +37,9 @@ def test_image_service():
     for i, prompt in enumerate(test_prompts):
         print(f"Testing prompt #{i+1}: {prompt}")
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             image_path = image_service.generate_image(prompt)
-            end_time = datetime.now()
-            
-            elapsed_seconds = (end_time - start_time).total_seconds()
+            elapsed_seconds = time.perf_counter() - start_time
             
             if image_path:
                 # Check if this is a fallback image
@@ -50,12 +49,12 @@ def test_image_service():
                 print(f"  Time taken: {elapsed_seconds:.2f} seconds")
                 print(f"  Fallback used: {'Yes' if is_fallback else 'No'}")
                 
-                # Get attribution if available
-                attribution_path = image_path + ".json"
-                attribution = None
-                if os.path.exists(attribution_path):
-                    with open(attribution_path, 'r') as f:
-                        attribution = json.load(f)
+                # Get attribution if available (fallback images have none)
+                try:
+                    with open(image_path + ".json", 'rb') as f:
+                        attribution = loads(f.read())
+                except FileNotFoundError:
+                    attribution = None
                 
                 results.append({
                     "prompt": prompt,
@@ -124,8 +123,8 @@ def test_image_service():
     output_dir = os.path.join(parent_dir, "logs")
     os.makedirs(output_dir, exist_ok=True)
     
-    with open(os.path.join(output_dir, "image_test_results.json"), "w") as f:
-        json.dump(test_results, f, indent=2)
+    with open(os.path.join(output_dir, "image_test_results.json"), "wb") as f:
+        f.write(dumps_bytes(test_results))
     
     print("\nTest results saved to logs/image_test_results.json")
     print("=" * 80)
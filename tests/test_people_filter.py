@@ -20,10 +20,8 @@ def test_people_filter():
     print(f'Topics with people filtering ON: {len(topics_without_people)}')
     
     # Find topics that were filtered out
-    filtered_out = []
-    for topic in topics_with_people:
-        if not any(t.get('topic') == topic.get('topic') for t in topics_without_people):
-            filtered_out.append(topic)
+    remaining = {t.get('topic') for t in topics_without_people}
+    filtered_out = [t for t in topics_with_people if t.get('topic') not in remaining]
     
     # Display filtered out topics
     print('\nTOPICS ABOUT PEOPLE (filtered out):')
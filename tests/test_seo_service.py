@@ -7,7 +7,7 @@ This will:
 
 import os
 import sys
-import json
+from itertools import islice
 from datetime import datetime
 
 # Add the parent directory to sys.path to allow importing from services
@@ -17,13 +17,10 @@ if parent_dir not in sys.path:
 
 # Import the SEO service
 from services.seo_service import seo_service
+from helpers.json_utils import dumps_bytes
 
-def test_seo_service():
-    print("Testing SEO Service...")
-    print("=" * 80)
-    
-    # Sample content with different qualities for testing
-    sample_content_good = """
+# Sample content with different qualities for testing
+SAMPLE_CONTENT_GOOD = """
     <h1>Ultimate Guide to SEO in 2024</h1>
     <p>Search Engine Optimization continues to evolve in 2024. With the rise of AI and new algorithms, businesses need to adapt their strategies to stay competitive in search results.</p>
     
@@ -50,60 +47,63 @@ def test_seo_service():
     <h2>Conclusion</h2>
     <p>SEO continues to evolve, but the fundamentals remain: create valuable content, optimize for technical excellence, and build your site's authority. By staying current with these best practices, you'll be well-positioned for SEO success in 2024 and beyond.</p>
     """
-    
-    sample_content_poor = """
+
+SAMPLE_CONTENT_POOR = """
     SEO Tips
     
     Here are some tips for better SEO. First, use keywords. Second, have good content. Third, get backlinks from other sites.
     
     Make sure your website loads fast. Also use headings.
     """
+
+def test_seo_service():
+    print("Testing SEO Service...")
+    print("=" * 80)
     
     # Analyze both samples
     print("Analyzing good quality content...")
-    good_analysis = seo_service.analyze_seo(sample_content_good)
+    good_analysis = seo_service.analyze_seo(SAMPLE_CONTENT_GOOD)
     
     print(f"Word count: {good_analysis['word_count']}")
     print(f"SEO score: {good_analysis['score']}")
     print(f"Headings: {good_analysis['headings']}")
     print(f"Paragraphs: {good_analysis['paragraphs']}")
-    print(f"Top keywords: {list(good_analysis['keywords'].keys())[:5]}")
+    print(f"Top keywords: {list(islice(good_analysis['keywords'], 5))}")
     
     if good_analysis['issues']:
         print("\nIssues found:")
-        for issue in good_analysis['issues']:
-            print(f"- {issue}")
+        print("\n".join(f"- {issue}" for issue in good_analysis['issues']))
     else:
         print("\nNo issues found!")
     
     print("\n" + "-" * 80 + "\n")
     
     print("Analyzing poor quality content...")
-    poor_analysis = seo_service.analyze_seo(sample_content_poor)
+    poor_analysis = seo_service.analyze_seo(SAMPLE_CONTENT_POOR)
     
     print(f"Word count: {poor_analysis['word_count']}")
     print(f"SEO score: {poor_analysis['score']}")
     print(f"Headings: {poor_analysis['headings']}")
     print(f"Paragraphs: {poor_analysis['paragraphs']}")
-    print(f"Top keywords: {list(poor_analysis['keywords'].keys())[:5]}")
+    print(f"Top keywords: {list(islice(poor_analysis['keywords'], 5))}")
     
     if poor_analysis['issues']:
         print("\nIssues found:")
-        for issue in poor_analysis['issues']:
-            print(f"- {issue}")
+        print("\n".join(f"- {issue}" for issue in poor_analysis['issues']))
     
     # Test improvement suggestions
     print("\nTesting improvement suggestions for poor content...")
     suggestions = seo_service.get_improvement_suggestions(
-        sample_content_poor, 
-        target_keywords=["SEO", "optimization", "search engine"]
+        SAMPLE_CONTENT_POOR, 
+        target_keywords=["SEO", "optimization", "search engine"],
+        seo_report=poor_analysis
     )
     
     print(f"Improvement score: {suggestions['score']}")
     
     print("\nImprovement suggestions:")
-    for suggestion in suggestions['suggestions']:
-        print(f"- [{suggestion['priority']}] {suggestion['suggestion']}")
+    if suggestions['suggestions']:
+        print("\n".join(f"- [{s['priority']}] {s['suggestion']}" for s in suggestions['suggestions']))
     
     # Save the results to a file for inspection
     results = {
@@ -116,8 +116,8 @@ def test_seo_service():
     output_dir = os.path.join(parent_dir, "logs")
     os.makedirs(output_dir, exist_ok=True)
     
-    with open(os.path.join(output_dir, "seo_test_results.json"), "w") as f:
-        json.dump(results, f, indent=2)
+    with open(os.path.join(output_dir, "seo_test_results.json"), "wb") as f:
+        f.write(dumps_bytes(results))
     
     print("\nTest results saved to logs/seo_test_results.json")
     print("=" * 80)
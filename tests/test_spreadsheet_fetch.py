@@ -9,15 +9,24 @@ spreadsheet rather than the fallback sample products.
 import os
 import sys
 import json
-from dotenv import load_dotenv
-from pprint import pprint
+from pprint import pformat
 
 # Add parent directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 # Load environment variables
-load_dotenv()
+from helpers.env_utils import load_env
+load_env()
+
+# Names of the sample products that used to be returned when the spreadsheet failed
+SAMPLE_PRODUCT_NAMES = frozenset({
+    "Premium Fitness Tracker",
+    "Professional Home Office Chair",
+    "Complete Web Development Course",
+    "Smart Home Security System",
+    "Organic Skincare Bundle"
+})
 
 def test_spreadsheet_fetch():
     """Test that we're fetching from the spreadsheet correctly"""
@@ -72,7 +81,7 @@ def test_spreadsheet_fetch():
     if raw_data:
         print(f"✅ Successfully fetched {len(raw_data)} rows from spreadsheet")
         print("\nSample raw data (first 2 rows):")
-        pprint(raw_data[:2])
+        print(pformat(raw_data[:2]))
     else:
         print("❌ Failed to fetch raw data from spreadsheet")
         return False
@@ -84,24 +93,15 @@ def test_spreadsheet_fetch():
     if affiliate_products:
         print(f"✅ Successfully fetched {len(affiliate_products)} formatted products")
         print("\nSample formatted products (first 2):")
-        pprint(affiliate_products[:2])
+        print(pformat(affiliate_products[:2]))
     else:
         print("❌ Failed to fetch formatted affiliate products")
         return False
     
     # 6. Verify we're NOT using sample products
     print("\nVerifying these are NOT sample products...")
-    sample_product_names = set([
-        "Premium Fitness Tracker",
-        "Professional Home Office Chair",
-        "Complete Web Development Course",
-        "Smart Home Security System",
-        "Organic Skincare Bundle"
-    ])
-    
-    product_names = set([p.get("product_name") for p in affiliate_products])
-    
-    if product_names.issubset(sample_product_names):
+    # all() stops at the first product that isn't a sample
+    if all(p.get("product_name") in SAMPLE_PRODUCT_NAMES for p in affiliate_products):
         print("❌ We are still using sample products, not fetching from your spreadsheet")
         return False
     else:
@@ -115,9 +115,7 @@ def test_spreadsheet_fetch():
         print(f"✅ ad_service successfully fetched {len(ad_service_products)} products")
         
         # Check if we're using the real data
-        ad_service_product_names = set([p.get("product_name") for p in ad_service_products])
-        
-        if ad_service_product_names.issubset(sample_product_names):
+        if all(p.get("product_name") in SAMPLE_PRODUCT_NAMES for p in ad_service_products):
             print("❌ ad_service is still using sample products")
             return False
         else:
@@ -7,7 +7,7 @@ This will:
 
 import os
 import sys
-import json
+import time
 from datetime import datetime
 
 # Add the parent directory to sys.path to allow importing from services
@@ -17,6 +17,11 @@ if parent_dir not in sys.path:
 
 # Import the trend service
 from services.trend_service import trend_service
+from helpers.json_utils import dumps_bytes
+
+# The module must expose the single, caching TrendService definition
+assert hasattr(trend_service, "_load_cached_data")
+assert hasattr(trend_service, "_save_cached_data")
 
 def test_trend_service():
     print("Testing Trend Service...")
@@ -30,22 +35,22 @@ def test_trend_service():
     print(f"Found {len(trends)} trending topics")
     print("-" * 80)
     
-    # Print and test each trend
+    # Print and test each trend, keeping the prompts for the results file
+    prompts = []
     for i, trend in enumerate(trends):
         print(f"Trend #{i+1}: {trend.get('source')} - {trend.get('topic')}")
         
         # Generate a blog prompt
         prompt = trend_service.generate_blog_topic(trend)
+        prompts.append(prompt)
         print(f"Blog prompt: {prompt[:100]}...")
         print("-" * 80)
     
     # Test caching
     print("\nTesting trend caching...")
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     cached_trends = trend_service.get_trending_topics(sources=sources, count=10)
-    end_time = datetime.now()
-    
-    elapsed_ms = (end_time - start_time).total_seconds() * 1000
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
     print(f"Cached retrieval took {elapsed_ms:.2f}ms")
     print(f"Retrieved {len(cached_trends)} cached trends")
     
@@ -53,14 +58,14 @@ def test_trend_service():
     results = {
         "timestamp": datetime.now().isoformat(),
         "trends": trends,
-        "blog_prompts": [trend_service.generate_blog_topic(trend) for trend in trends]
+        "blog_prompts": prompts
     }
     
     output_dir = os.path.join(parent_dir, "logs")
     os.makedirs(output_dir, exist_ok=True)
     
-    with open(os.path.join(output_dir, "trend_test_results.json"), "w") as f:
-        json.dump(results, f, indent=2)
+    with open(os.path.join(output_dir, "trend_test_results.json"), "wb") as f:
+        f.write(dumps_bytes(results))
     
     print("\nTest results saved to logs/trend_test_results.json")
     print("=" * 80)